@@ -7,10 +7,69 @@ Usage:
     # Make sure to run in the application's virtual Python environment
     python3 check_dependencies.py
 """
+import os
 import sys
+import shutil
+import functools
 import subprocess
-import importlib.util
-from pathlib import Path
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from importlib import metadata
+
+
+# (package_name, import_name) pairs checked by run_all_checks
+_CORE_PACKAGES = (
+    ('openai-whisper', 'whisper'),
+    ('torch', 'torch'),
+    ('torchaudio', 'torchaudio'),
+    ('numpy', 'numpy'),
+    ('opencv-python', 'cv2'),
+)
+_OPTIONAL_PACKAGES = (
+    ('openai', 'openai'),
+    ('anthropic', 'anthropic'),
+    ('streamlit', 'streamlit'),
+    ('pytest', 'pytest'),
+)
+_SUPPORT_PACKAGES = (
+    ('tiktoken', 'tiktoken'),
+    ('numba', 'numba'),
+    ('more-itertools', 'more_itertools'),
+    ('ffmpeg-python', 'ffmpeg'),
+)
+
+# Flattened (package_name, import_name, required) triples, built once
+_PACKAGES_TO_CHECK = (
+    tuple((pkg_name, import_name, True) for pkg_name, import_name in _CORE_PACKAGES)
+    + tuple((pkg_name, import_name, False) for pkg_name, import_name in _OPTIONAL_PACKAGES)
+    + tuple((pkg_name, import_name, True) for pkg_name, import_name in _SUPPORT_PACKAGES)
+)
+
+
+# Searched after PATH when looking up system commands
+_EXTRA_COMMAND_DIRS = (
+    '/opt/homebrew/bin',  # Homebrew on Apple Silicon
+    '/usr/local/bin',     # Homebrew on Intel Mac / Linux
+    '/usr/bin',           # System binaries
+)
+
+
+# Prints 'ok', 'nan' or 'unavailable'; run in a subprocess by _probe_mps
+_MPS_PROBE_SCRIPT = """
+import torch
+if not torch.backends.mps.is_available():
+    print('unavailable')
+else:
+    result = torch.softmax(torch.randn(1, 10, device='mps'), dim=-1)
+    print('nan' if torch.isnan(result).any() else 'ok')
+"""
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_find_spec(name):
+    """Cached importlib.util.find_spec (each lookup walks sys.path on disk)."""
+    import importlib.util  # deferred until the first package check
+    return importlib.util.find_spec(name)
 
 
 class DependencyChecker:
@@ -20,146 +79,256 @@ class DependencyChecker:
         self.errors = []
         self.warnings = []
         self.info = []
+        self._mps_thread = None
+        self._mps_messages = []
+        self._lock = threading.Lock()
+    
+    def _emit(self, level, msg):
+        """Record a message and print it immediately so progress is visible."""
+        with self._lock:
+            {'info': self.info, 'warning': self.warnings, 'error': self.errors}[level].append(msg)
+            print(f"  {msg}", flush=True)
+    
+    def _emit_all(self, info, warnings, errors):
+        for msg in info:
+            self._emit('info', msg)
+        for msg in warnings:
+            self._emit('warning', msg)
+        for msg in errors:
+            self._emit('error', msg)
         
     def check_python_version(self):
         """Check Python version is 3.9+"""
         version = sys.version_info
         if version.major < 3 or (version.major == 3 and version.minor < 9):
-            self.errors.append(
+            self._emit('error',
                 f"❌ Python 3.9+ required (found {version.major}.{version.minor}.{version.micro})"
             )
             return False
         else:
-            self.info.append(
+            self._emit('info',
                 f"✓ Python version: {version.major}.{version.minor}.{version.micro}"
             )
             return True
     
     def check_system_command(self, command, required=True):
         """Check if a system command exists."""
-        # Common paths to check (in order of preference)
-        common_paths = [
-            None,  # Use 'which' first
-            f"/opt/homebrew/bin/{command}",  # Homebrew on Apple Silicon
-            f"/usr/local/bin/{command}",     # Homebrew on Intel Mac / Linux
-            f"/usr/bin/{command}",           # System binaries
-        ]
+        return self.check_system_commands([(command, required)])[0]
+    
+    def check_system_commands(self, commands):
+        """Check several (command, required) pairs, probing versions concurrently.
+
+        Each version probe can take up to its 2s timeout, so running them in
+        parallel bounds the total wait by the slowest probe rather than the sum.
+        Results are reported in the order given.
+        """
+        found_paths = [self._find_command(command) for command, _ in commands]
+        to_probe = [path for path in found_paths if path]
         
-        found_path = None
+        versions = {}
+        if to_probe:
+            with ThreadPoolExecutor(max_workers=len(to_probe)) as executor:
+                versions = dict(zip(to_probe, executor.map(self._probe_version, to_probe)))
         
-        # Try 'which' first
+        results = []
+        for (command, required), found_path in zip(commands, found_paths):
+            if found_path:
+                self._emit('info', f"✓ {command}: {found_path}")
+                version_line = versions.get(found_path)
+                if version_line:
+                    self._emit('info', f"  Version: {version_line[:80]}")
+                results.append(True)
+            else:
+                if required:
+                    self._emit('error',
+                        f"❌ {command} not found - required for video/audio processing"
+                    )
+                    self._emit('error', f"   Install with: brew install {command}")
+                    self._emit('error', f"   After installing, restart your terminal or run: source ~/.zshrc")
+                else:
+                    self._emit('warning',
+                        f"⚠️  {command} not found (optional but recommended)"
+                    )
+                results.append(False)
+        return results
+    
+    def _find_command(self, command):
+        """Return the path to a system command, or None if it can't be found."""
+        # Search PATH plus common install locations in-process, in case PATH
+        # is misconfigured (e.g. Homebrew not yet on PATH in a fresh shell)
+        search_path = os.pathsep.join(
+            filter(None, (os.environ.get('PATH', ''),) + _EXTRA_COMMAND_DIRS)
+        )
+        return shutil.which(command, path=search_path)
+    
+    @staticmethod
+    def _probe_version(found_path):
+        """Return the first line of `<command> -version`, or '' on failure."""
         try:
-            result = subprocess.run(
-                ['which', command],
+            version_result = subprocess.run(
+                [found_path, '-version'],
                 capture_output=True,
                 text=True,
-                check=False
+                check=False,
+                timeout=2
             )
-            if result.returncode == 0:
-                found_path = result.stdout.strip()
+            return version_result.stdout.split('\n')[0] if version_result.stdout else ''
         except:
-            pass
-        
-        # If 'which' didn't find it, check common paths
-        if not found_path:
-            for path in common_paths[1:]:  # Skip None
-                if Path(path).exists():
-                    found_path = path
-                    break
-        
-        if found_path:
-            # Get version if possible
-            try:
-                version_result = subprocess.run(
-                    [found_path, '-version'],
-                    capture_output=True,
-                    text=True,
-                    check=False,
-                    timeout=2
-                )
-                version_line = version_result.stdout.split('\n')[0] if version_result.stdout else ''
-                self.info.append(f"✓ {command}: {found_path}")
-                if version_line:
-                    self.info.append(f"  Version: {version_line[:80]}")
-            except:
-                self.info.append(f"✓ {command}: {found_path}")
-            return True
-        else:
-            if required:
-                self.errors.append(
-                    f"❌ {command} not found - required for video/audio processing"
-                )
-                self.errors.append(f"   Install with: brew install {command}")
-                self.errors.append(f"   After installing, restart your terminal or run: source ~/.zshrc")
-            else:
-                self.warnings.append(
-                    f"⚠️  {command} not found (optional but recommended)"
-                )
-            return False
+            return ''
     
     def check_python_package(self, package_name, import_name=None, required=True):
         """Check if a Python package is installed."""
+        info, warnings, errors = self._check_one(package_name, import_name, required)
+        self._emit_all(info, warnings, errors)
+        installed = not errors and not warnings
+        if package_name == 'torch' and installed:
+            self.check_torch_mps()
+        return installed
+
+    def _check_one(self, package_name, import_name=None, required=True):
+        """Probe a single Python package without touching shared state.
+
+        Returns an ``(info, warnings, errors)`` tuple of message lists so the
+        probe can safely run on a worker thread.
+        """
         if import_name is None:
             import_name = package_name
+        info, warnings, errors = [], [], []
         
-        spec = importlib.util.find_spec(import_name)
+        spec = _cached_find_spec(import_name)
         if spec is None:
             if required:
-                self.errors.append(
+                errors.append(
                     f"❌ Python package '{package_name}' not installed"
                 )
             else:
-                self.warnings.append(
+                warnings.append(
                     f"⚠️  Python package '{package_name}' not installed (optional)"
                 )
-            return False
         else:
-            # Try to get version
+            # Read the version from the installed distribution metadata rather
+            # than importing the module (importing torch/cv2 is slow and heavy)
             try:
-                module = importlib.import_module(import_name)
-                version = getattr(module, '__version__', 'unknown')
-                self.info.append(f"✓ {package_name}: {version}")
-                
-                # Special check for torch MPS stability
-                if package_name == 'torch':
-                    try:
-                        import torch
-                        if torch.backends.mps.is_available():
-                            # Test MPS stability
-                            test_tensor = torch.randn(1, 10, device='mps')
-                            test_result = torch.softmax(test_tensor, dim=-1)
-                            if torch.isnan(test_result).any():
-                                self.warnings.append(
-                                    "⚠️  MPS (Apple Silicon GPU) test failed - may cause NaN errors during Whisper inference"
-                                )
-                                self.warnings.append(
-                                    "   The application will automatically fall back to CPU if MPS issues occur"
-                                )
-                            else:
-                                self.info.append("✓ MPS (Apple Silicon GPU) stability test passed")
-                        else:
-                            self.info.append("  MPS not available (expected on Intel Macs)")
-                    except Exception as e:
-                        self.warnings.append(
-                            f"⚠️  Could not test MPS stability: {e}"
-                        )
-                        
-            except:
-                self.info.append(f"✓ {package_name}: installed")
-            return True
+                info.append(f"✓ {package_name}: {metadata.version(package_name)}")
+            except metadata.PackageNotFoundError:
+                info.append(f"✓ {package_name}: unknown")
+            except Exception:
+                info.append(f"✓ {package_name}: installed")
+        return info, warnings, errors
+
+    def check_python_packages(self, packages):
+        """Check several (package_name, import_name, required) triples concurrently.
+
+        The probes are I/O-bound module loads, so they overlap well on a thread
+        pool. Messages are emitted in the original order to keep the report
+        deterministic.
+        """
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            # map() yields in submission order as results become ready, so
+            # each package is reported as soon as it (and those before it) finish
+            for info, warnings, errors in executor.map(lambda pkg: self._check_one(*pkg), packages):
+                self._emit_all(info, warnings, errors)
+    
+    def check_torch_mps(self):
+        """Special check for torch MPS stability."""
+        self._probe_mps()
+        self._merge_mps_messages()
+    
+    def start_torch_mps_probe(self):
+        """Start the torch MPS probe on a background thread.
+
+        Importing torch and running the test tensor takes seconds, so it runs
+        alongside the other checks; call finish_torch_mps_probe() to collect it.
+        """
+        self._mps_thread = None
+        self._mps_messages = []
+        if _cached_find_spec('torch') is None:
+            return
+        self._mps_thread = threading.Thread(target=self._probe_mps, daemon=True)
+        self._mps_thread.start()
+    
+    def finish_torch_mps_probe(self, timeout=10):
+        """Wait for the background MPS probe and merge its messages."""
+        if self._mps_thread is None:
+            return
+        self._mps_thread.join(timeout=timeout)
+        if self._mps_thread.is_alive():
+            self._emit('warning', "⚠️  Could not test MPS stability: probe timed out")
+            return
+        self._merge_mps_messages()
+    
+    def _probe_mps(self):
+        """Run the MPS stability test, storing (level, message) pairs."""
+        messages = []
+        try:
+            # Run in a short-lived interpreter so torch's memory is released as
+            # soon as the probe exits, and a crashing MPS backend can't take
+            # down the checker itself
+            result = subprocess.run(
+                [sys.executable, '-c', _MPS_PROBE_SCRIPT],
+                capture_output=True,
+                text=True,
+                check=False,
+                timeout=10
+            )
+            outcome = result.stdout.strip()
+            if outcome == 'nan':
+                messages.append((
+                    'warning',
+                    "⚠️  MPS (Apple Silicon GPU) test failed - may cause NaN errors during Whisper inference"
+                ))
+                messages.append((
+                    'warning',
+                    "   The application will automatically fall back to CPU if MPS issues occur"
+                ))
+            elif outcome == 'ok':
+                messages.append(('info', "✓ MPS (Apple Silicon GPU) stability test passed"))
+            elif outcome == 'unavailable':
+                messages.append(('info', "  MPS not available (expected on Intel Macs)"))
+            else:
+                error = (result.stderr.strip().splitlines() or [f"exit code {result.returncode}"])[-1]
+                messages.append(('warning', f"⚠️  Could not test MPS stability: {error}"))
+        except Exception as e:
+            messages.append(('warning', f"⚠️  Could not test MPS stability: {e}"))
+        self._mps_messages = messages
+    
+    def _merge_mps_messages(self):
+        for level, msg in self._mps_messages:
+            self._emit(level, msg)
     
     def check_file_exists(self, filepath, description):
         """Check if a required file exists."""
-        path = Path(filepath)
-        if not path.exists():
-            self.warnings.append(
+        if not os.path.exists(filepath):
+            self._emit('warning',
                 f"⚠️  {description} not found: {filepath}"
             )
             return False
         else:
-            self.info.append(f"✓ {description}: {filepath}")
+            self._emit('info', f"✓ {description}: {filepath}")
             return True
     
+    def check_files_exist(self, files):
+        """Check a {filepath: description} mapping with one scan per directory.
+
+        Listing each parent directory once is cheaper than a stat() per file,
+        especially on network filesystems.
+        """
+        existing = set()
+        for directory in {os.path.dirname(filepath) for filepath in files}:
+            try:
+                with os.scandir(directory or '.') as entries:
+                    existing.update(os.path.join(directory, entry.name) for entry in entries)
+            except OSError:
+                pass
+        
+        for filepath, description in files.items():
+            if filepath in existing:
+                self._emit('info', f"✓ {description}: {filepath}")
+            else:
+                self._emit('warning',
+                    f"⚠️  {description} not found: {filepath}"
+                )
+    
     def run_all_checks(self):
         """Run all dependency checks."""
         print("=" * 70)
@@ -167,82 +336,59 @@ class DependencyChecker:
         print("=" * 70)
         print()
         
-        # Python version
-        self.check_python_version()
+        # Python version - nothing else is meaningful on an unsupported
+        # interpreter, so stop before any import probes or subprocesses
+        if not self.check_python_version():
+            print()
+            return self.print_results()
         print()
         
+        # Kick off the slow torch MPS probe so it overlaps the other checks
+        self.start_torch_mps_probe()
+        
         # System dependencies
         print("Checking system dependencies...")
-        self.check_system_command('ffmpeg', required=True)
-        print()
-        
-        # Core Python packages
-        print("Checking core Python packages...")
-        core_packages = [
-            ('openai-whisper', 'whisper'),
-            ('torch', 'torch'),
-            ('torchaudio', 'torchaudio'),
-            ('numpy', 'numpy'),
-            ('opencv-python', 'cv2'),
-        ]
-        for pkg_name, import_name in core_packages:
-            self.check_python_package(pkg_name, import_name, required=True)
-        print()
-        
-        # Optional Python packages
-        print("Checking optional Python packages...")
-        optional_packages = [
-            ('openai', 'openai'),
-            ('anthropic', 'anthropic'),
-            ('streamlit', 'streamlit'),
-            ('pytest', 'pytest'),
-        ]
-        for pkg_name, import_name in optional_packages:
-            self.check_python_package(pkg_name, import_name, required=False)
+        self.check_system_commands([('ffmpeg', True)])
         print()
         
-        # Supporting Python packages
-        print("Checking supporting Python packages...")
-        support_packages = [
-            ('tiktoken', 'tiktoken'),
-            ('numba', 'numba'),
-            ('more-itertools', 'more_itertools'),
-            ('ffmpeg-python', 'ffmpeg'),
-        ]
-        for pkg_name, import_name in support_packages:
-            self.check_python_package(pkg_name, import_name, required=True)
+        # Python packages (core, optional and supporting are independent, so
+        # probe them all in one concurrent batch)
+        print("Checking Python packages...")
+        self.check_python_packages(_PACKAGES_TO_CHECK)
         print()
         
         # Project structure
         print("Checking project structure...")
-        self.check_file_exists('src/video_evaluator.py', 'Core evaluator')
-        self.check_file_exists('Home.py', 'Streamlit app (main)')
-        self.check_file_exists('pages/2_Analyze_Video.py', 'Streamlit app (analyze page)')
-        self.check_file_exists('requirements.txt', 'Requirements file')
+        self.check_files_exist({
+            'src/video_evaluator.py': 'Core evaluator',
+            'Home.py': 'Streamlit app (main)',
+            'pages/2_Analyze_Video.py': 'Streamlit app (analyze page)',
+            'requirements.txt': 'Requirements file',
+        })
         print()
         
-        # Print results
+        self.finish_torch_mps_probe()
+        
+        return self.print_results()
+    
+    def print_results(self):
+        """Print the summary and return True if the application can run."""
         print("=" * 70)
         print("RESULTS")
         print("=" * 70)
         print()
         
-        if self.info:
-            print("✓ Installed components:")
-            for msg in self.info:
-                print(f"  {msg}")
-            print()
+        # Indented messages are continuation lines (versions, install hints)
+        def tally(messages):
+            return sum(1 for msg in messages if not msg.startswith(' '))
         
-        if self.warnings:
-            print("⚠️  Warnings:")
-            for msg in self.warnings:
-                print(f"  {msg}")
-            print()
+        print(f"✓ Installed components: {tally(self.info)}")
+        print(f"⚠️  Warnings: {tally(self.warnings)}")
+        print(f"❌ Errors: {tally(self.errors)}")
+        print()
         
         if self.errors:
-            print("❌ ERRORS - Cannot run application:")
-            for msg in self.errors:
-                print(f"  {msg}")
+            print("❌ ERRORS - Cannot run application.")
             print()
             print("Fix the errors above and run this check again.")
             print()
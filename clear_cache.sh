@@ -17,6 +17,13 @@ find . -name "*.pyo" -delete 2>/dev/null
 find . -name "*.pyd" -delete 2>/dev/null
 
 echo "✅ Python cache cleared!"
+
+# Remove cached Whisper transcripts (see TRANSCRIPT_CACHE_DIR in src/video_evaluator.py)
+TRANSCRIPT_CACHE="$(python3 -c 'import tempfile; print(tempfile.gettempdir())' 2>/dev/null || echo "${TMPDIR:-/tmp}")/video_eval_transcripts"
+if [ -d "$TRANSCRIPT_CACHE" ]; then
+    rm -rf "$TRANSCRIPT_CACHE"
+    echo "✅ Transcript cache cleared!"
+fi
 echo ""
 echo "💡 Tip: Run this script whenever you:"
 echo "   - Modify function signatures"
@@ -8,9 +8,35 @@ from dotenv import load_dotenv
 load_dotenv(os.path.join(os.path.dirname(__file__), '..', '.env'))
 
 import streamlit as st
+import pandas as pd
+import re
 import json
+import html
+import shutil
+import time
+import tempfile
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from pathlib import Path
-from datetime import datetime
+from urllib.parse import urlparse
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from streamlit.runtime.scriptrunner_utils.script_run_context import SCRIPT_RUN_CONTEXT_ATTR_NAME
+
+from rubric_cache import rubrics_signature
+
+# orjson is much faster for the large result dicts (transcripts etc.);
+# fall back to the stdlib if it isn't installed
+try:
+    import orjson
+    def json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    json_loads = orjson.loads
+except ImportError:
+    def json_dumps(obj):
+        return json.dumps(obj, indent=2)
+    json_loads = json.loads
 
 st.set_page_config(
     page_title="Analyze Video - AI Video Analyzer",
@@ -47,70 +73,281 @@ def load_config():
     return {}
 
 def save_config(config):
-    """Save configuration to file."""
+    """Save configuration to file (skipped if nothing changed since the last save)."""
+    if config == st.session_state.get('saved_app_config'):
+        return
     try:
         CONFIG_FILE.parent.mkdir(exist_ok=True)
         with open(CONFIG_FILE, 'w') as f:
             json.dump(config, f, indent=2)
+        st.session_state.saved_app_config = dict(config)
     except Exception as e:
         st.error(f"Failed to save configuration: {e}")
 
-# Get available rubrics (refreshed on each page load)
-available_rubrics = list_available_rubrics()
-rubric_options = {r['name']: r['filename'] for r in available_rubrics}
-rubric_descriptions = {r['name']: r['description'] for r in available_rubrics}
+RUBRICS_DIR = Path(__file__).parent.parent / "rubrics"
 
-# Configuration management for default rubric
-CONFIG_FILE = Path(__file__).parent.parent / ".streamlit_config.json"
+@st.cache_data(show_spinner=False)
+def cached_rubrics(signature):
+    """List available rubrics; re-scanned only when the rubrics directory changes.
 
-def load_config():
-    """Load configuration from file."""
-    if CONFIG_FILE.exists():
-        try:
-            with open(CONFIG_FILE, 'r') as f:
-                return json.load(f)
-        except:
-            pass
-    return {}
+    Returns:
+        Tuple of (name -> filename, name -> description, filename -> name) dicts
+    """
+    available_rubrics = list_available_rubrics()
+    rubric_options = {r['name']: r['filename'] for r in available_rubrics}
+    rubric_descriptions = {r['name']: r['description'] for r in available_rubrics}
+    filename_to_name = {filename: name for name, filename in rubric_options.items()}
+    return rubric_options, rubric_descriptions, filename_to_name
 
-def save_config(config):
-    """Save configuration to file."""
+@st.cache_data(show_spinner=False)
+def load_rubric_json(rubric_filename, mtime):
+    """Parse a rubric JSON file; cached per (filename, mtime)."""
     try:
-        CONFIG_FILE.parent.mkdir(exist_ok=True)
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(config, f, indent=2)
-    except Exception as e:
-        st.error(f"Failed to save configuration: {e}")
+        # Raw bytes straight to the parser, skipping the text decode layer
+        return json_loads((RUBRICS_DIR / f"{rubric_filename}.json").read_bytes())
+    except:
+        return {}
+
+def rubric_mtime(rubric_filename):
+    """Return the rubric file's modification time, or None if it doesn't exist."""
+    try:
+        return os.path.getmtime(RUBRICS_DIR / f"{rubric_filename}.json")
+    except OSError:
+        return None
+
+@st.cache_data(show_spinner=False)
+def cached_rubric_maps(rubric_filename, mtime):
+    """Build the rubric's label/weight/criteria lookups; cached per (filename, mtime)."""
+    return build_rubric_maps(load_rubric_json(rubric_filename, mtime))
+
+def load_rubric_maps(rubric_filename):
+    """Load rubric lookups for rendering, rebuilding them only if the file changed."""
+    mtime = rubric_mtime(rubric_filename)
+    if mtime is None:
+        return build_rubric_maps({})
+    return cached_rubric_maps(rubric_filename, mtime)
+
+def get_evaluator(rubric_filename, provider_name, enable_vision, translate, method,
+                  api_key, openai_api_key, progress_callback):
+    """Build a VideoEvaluator for one analysis.
+
+    Each analysis gets its own evaluator (and so its own temp directory and
+    progress callback); the Whisper model itself is loaded once per process
+    and shared, so construction is cheap.
+    """
+    return VideoEvaluator(
+        rubric_path=rubric_filename,
+        api_key=api_key,
+        provider=AIProvider.OPENAI if provider_name == 'openai' else AIProvider.ANTHROPIC,
+        enable_vision=enable_vision,
+        verbose=True,  # Back to normal - chunking now works properly
+        translate_to_english=translate,
+        progress_callback=progress_callback,
+        transcription_method=method,
+        openai_api_key=openai_api_key  # Always pass OpenAI key for Whisper API
+    )
+
+@st.cache_resource(show_spinner=False)
+def analysis_executor():
+    """Shared worker pool that runs analyses off the script thread."""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix='analysis')
+
+@st.cache_resource(show_spinner=False)
+def results_writer():
+    """Single background worker that writes results files to disk."""
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix='results-writer')
+
+def run_in_script_context(ctx, fn, *args, **kwargs):
+    """Run fn on a worker thread with the submitting script's run context attached."""
+    thread = threading.current_thread()
+    add_script_run_ctx(thread, ctx)
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        # Pool threads are reused, so don't leave the next job bound to this session
+        setattr(thread, SCRIPT_RUN_CONTEXT_ATTR_NAME, None)
+
+@st.fragment(run_every=1)
+def analysis_status(job):
+    """Show progress of a running analysis.
+
+    Runs as a fragment polling every second, so only this block reruns while
+    the worker is busy; the full page reruns once to collect the result.
+    """
+    if job['future'].done():
+        st.rerun()
+    # A single status container, updated in place on each poll
+    with st.status(job['progress']['step'], expanded=True, state="running"):
+        st.write("**Analysis in progress** - This can take several minutes depending on video length and model used for transcription/translation. You can keep using the page while it runs.")
+
+def progress_step(message):
+    """Map an internal progress message to a UI step line (None if not a step)."""
+    if "Downloading from URL" in message:
+        return "⏳ **Step 1/4:** Downloading video/audio..."
+    elif "Download complete" in message:
+        return "⏳ **Step 2/4:** Transcribing audio with Whisper..."
+    elif "Transcribing audio" in message:
+        # Extract model and device info from message like "🎤 Transcribing audio with Whisper base model on CPU..."
+        if "Whisper" in message and "model" in message:
+            return f"⏳ **Step 2/4:** {message.replace('🎤 ', '')}"
+        elif "OpenAI API" in message:
+            return "⏳ **Step 2/4:** Transcribing with OpenAI API..."
+        else:
+            return "⏳ **Step 2/4:** Transcribing audio with Whisper model..."
+    elif "Analyzing video frames" in message:
+        return "⏳ **Step 3/4:** Analyzing video frames..."
+    elif "Evaluating transcript" in message:
+        return "⏳ **Step 3/4:** Evaluating with AI..."
+    elif "Generating qualitative feedback" in message:
+        return "⏳ **Step 4/4:** Generating feedback..."
+    return None
+
+def parse_video_url(video_url):
+    """Parse a video URL.
+
+    Returns:
+        Tuple of (parsed URL or None, is_valid). An empty URL counts as valid.
+    """
+    if not video_url:
+        return None, True
+    try:
+        parsed = urlparse(video_url)
+        return parsed, all([parsed.scheme in ['http', 'https'], parsed.netloc])
+    except:
+        return None, False
+
+# Visual analysis text patterns: an explicit "no (clear) mismatch" means clean,
+# otherwise any of the problem indicators means a mismatch was found
+NO_MISMATCH_RE = re.compile(r'no\s+(?:clear\s+)?mismatch', re.IGNORECASE)
+MISMATCH_RE = re.compile(
+    r'mismatch detected|does not match|not visible|inconsistent|contradiction|discrepancy',
+    re.IGNORECASE
+)
+
+def has_visual_mismatch(visual_text):
+    """Return True if the visual analysis reports a transcript/visual mismatch."""
+    return not NO_MISMATCH_RE.search(visual_text) and bool(MISMATCH_RE.search(visual_text))
+
+# Phrases used by the evaluator's generic, score-derived feedback
+FALLBACK_FEEDBACK_MARKERS = ('Good performance in this area.', 'Consider focusing on improving this aspect.')
 
-# Load configuration and determine default rubric
-config = load_config()
+def is_fallback_description(description):
+    """Return True if a feedback description is the generic fallback text."""
+    return 'You scored' in description and any(marker in description for marker in FALLBACK_FEEDBACK_MARKERS)
+
+# Low/medium/high lookups, indexed by how many thresholds a value meets
+STOPLIGHT_ICONS = ("🔴", "🟡", "🟢")
+CONFIDENCE_LABELS = ("Low", "Medium", "High")
+
+def score_icon_for(percentage):
+    """Stoplight icon for a score percentage (>= 80 green, >= 60 yellow)."""
+    return STOPLIGHT_ICONS[(percentage >= 60) + (percentage >= 80)]
+
+def confidence_icon_for(confidence):
+    """Stoplight icon for a 0-10 confidence (>= 8 green, >= 6 yellow)."""
+    return STOPLIGHT_ICONS[(confidence >= 6) + (confidence >= 8)]
+
+def confidence_label(confidence):
+    """High/Medium/Low label for a 0-10 confidence."""
+    return CONFIDENCE_LABELS[(confidence >= 6) + (confidence >= 8)]
+
+def render_table(rows):
+    """Render a list of row dicts as one table element (column order from the first row)."""
+    st.dataframe(pd.DataFrame(rows), use_container_width=True, hide_index=True)
+
+def normalize_feedback_items(items, default_title):
+    """Flatten feedback item dicts to (title, description) tuples, applying defaults."""
+    return [(item.get('title', default_title), item.get('description', '')) for item in items]
+
+def feedback_items_markdown(items):
+    """Render (title, description) items as one markdown block of open <details> sections.
+
+    A single markdown element replaces an expander per item. Titles and
+    descriptions come from the AI, so they are HTML-escaped.
+    """
+    return "\n\n".join(
+        f"<details open><summary><b>{html.escape(title)}</b></summary>\n\n"
+        f"{html.escape(description)}\n\n</details>"
+        for title, description in items
+    )
+
+def build_rubric_maps(rubric_data):
+    """Build the label/weight/criteria lookups used to render results."""
+    category_labels = {}
+    category_weights = {}
+    category_criteria = {}
+    criterion_labels = {}
+    if rubric_data:
+        if "categories" in rubric_data:
+            # New format
+            categories = rubric_data["categories"]
+            category_labels = {category["category_id"]: category["label"] for category in categories}
+            category_weights = {category["category_id"]: category.get("weight", 0) for category in categories}
+            category_criteria = {
+                category["category_id"]: [criterion["criterion_id"] for criterion in category["criteria"]]
+                for category in categories
+            }
+            criterion_labels = {
+                criterion["criterion_id"]: criterion["label"]
+                for category in categories
+                for criterion in category["criteria"]
+            }
+        else:
+            # Old format
+            criterion_labels = {criterion["id"]: criterion["label"] for criterion in rubric_data["criteria"]}
+    return {
+        'category_labels': category_labels,
+        'category_weights': category_weights,
+        'category_criteria': category_criteria,
+        'criterion_labels': criterion_labels,
+    }
+
+@st.cache_resource(show_spinner=False)
+def ffmpeg_path():
+    """Locate ffmpeg once per process rather than spawning `which` every rerun."""
+    return shutil.which('ffmpeg')
+
+# Valid keys have the provider prefix and aren't the .env.example placeholder
+OPENAI_KEY_RE = re.compile(r'^sk-(?!.*your-openai-key-here$).+')
+ANTHROPIC_KEY_RE = re.compile(r'^sk-ant-(?!.*your-anthropic-key-here$).+')
+
+def validate_api_keys():
+    """Read and validate API keys from the environment.
+
+    Returns:
+        Tuple of (openai_valid, anthropic_valid, openai_key, anthropic_key)
+    """
+    openai_key = os.getenv('OPENAI_API_KEY')
+    anthropic_key = os.getenv('ANTHROPIC_API_KEY')
+    openai_valid = bool(OPENAI_KEY_RE.match(openai_key or ''))
+    anthropic_valid = bool(ANTHROPIC_KEY_RE.match(anthropic_key or ''))
+    return openai_valid, anthropic_valid, openai_key, anthropic_key
+
+# Get available rubrics (re-scanned only when the rubrics directory changes)
+rubric_options, rubric_descriptions, filename_to_name = cached_rubrics(rubrics_signature())
+
+# Load configuration once per session and determine default rubric
+if 'app_config' not in st.session_state:
+    st.session_state.app_config = load_config()
+    st.session_state.saved_app_config = dict(st.session_state.app_config)
+config = st.session_state.app_config
 default_rubric_filename = config.get('default_rubric', 'sample-rubric')  # Default to 'sample-rubric'
 
 # Validate that the configured default rubric still exists
-if default_rubric_filename not in rubric_options.values():
+if default_rubric_filename not in filename_to_name:
     # Clear invalid default rubric from config
     if 'default_rubric' in config:
         del config['default_rubric']
         save_config(config)
     default_rubric_filename = 'sample-rubric'  # Reset to default
 
-# Find the rubric name that corresponds to the default filename
-default_rubric_name = None
-for name, filename in rubric_options.items():
-    if filename == default_rubric_filename:
-        default_rubric_name = name
-        break
-
-# If the configured default doesn't exist, fall back to 'sample-rubric' or the first available
-if not default_rubric_name:
-    if 'sample-rubric' in rubric_options.values():
-        for name, filename in rubric_options.items():
-            if filename == 'sample-rubric':
-                default_rubric_name = name
-                break
-    else:
-        # Fall back to first available rubric
-        default_rubric_name = list(rubric_options.keys())[0] if rubric_options else None
+# Find the rubric name that corresponds to the default filename, falling back
+# to 'sample-rubric' or the first available
+default_rubric_name = (
+    filename_to_name.get(default_rubric_filename)
+    or filename_to_name.get('sample-rubric')
+    or next(iter(rubric_options), None)
+)
 
 # Hide anchor links on headers to prevent link mouseover
 st.markdown("""
@@ -139,10 +376,11 @@ if 'score_overrides' not in st.session_state:
 with st.sidebar:
     # Rubric selection (moved to top of sidebar)
     st.subheader("⚙️ Evaluation Settings")
+    rubric_names = list(rubric_options)
     selected_rubric_name = st.selectbox(
         'Evaluation Rubric',
-        options=list(rubric_options.keys()),
-        index=list(rubric_options.keys()).index(default_rubric_name) if default_rubric_name in rubric_options else 0,
+        options=rubric_names,
+        index=rubric_names.index(default_rubric_name) if default_rubric_name in rubric_options else 0,
         help='Choose the rubric to use for evaluation'
     )
     if selected_rubric_name:
@@ -162,26 +400,23 @@ with st.sidebar:
     st.subheader("System Status")
     
     # Check API keys
-    openai_key = os.getenv('OPENAI_API_KEY')
-    anthropic_key = os.getenv('ANTHROPIC_API_KEY')
+    openai_valid, anthropic_valid, openai_key, anthropic_key = validate_api_keys()
     
     # Check OpenAI key
-    if openai_key and openai_key.startswith('sk-') and not openai_key.endswith('your-openai-key-here'):
+    if openai_valid:
         st.success("✓ OpenAI API key loaded")
     else:
         st.error("❌ OpenAI API key missing or invalid")
     
     # Check Anthropic key
-    if anthropic_key and anthropic_key.startswith('sk-ant-') and not anthropic_key.endswith('your-anthropic-key-here'):
+    if anthropic_valid:
         st.success("✓ Anthropic API key loaded")
     else:
         st.warning("⚠️ Anthropic API key missing or invalid (optional)")
     
     # Quick check for ffmpeg
-    import subprocess
     try:
-        result = subprocess.run(['which', 'ffmpeg'], capture_output=True, text=True, check=False)
-        if result.returncode == 0:
+        if ffmpeg_path():
             st.success("✓ ffmpeg installed")
         else:
             st.error("❌ ffmpeg not found")
@@ -201,13 +436,11 @@ with col2:
 
 partner_name = st.text_input("Partner Name", placeholder="Enter partner name (e.g. AHEAD, Bynet, WWT etc.)")
 
-# Initialize session state for tracking uploaded file and URL
-if 'uploaded_file' not in st.session_state:
-    st.session_state.uploaded_file = None
-if 'video_url' not in st.session_state:
-    st.session_state.video_url = ''
-if 'score_overrides' not in st.session_state:
-    st.session_state.score_overrides = {}
+def on_file_uploaded():
+    """Store the uploaded file and clear the URL when the uploader changes."""
+    st.session_state.uploaded_file = st.session_state.file_uploader
+    if st.session_state.uploaded_file is not None:
+        st.session_state.video_url = ''  # Clear URL when file uploaded
 
 # Input method selection
 input_method = st.radio(
@@ -217,27 +450,16 @@ input_method = st.radio(
 )
 
 if input_method == "Upload File":
-    # File upload - use disabled parameter to truly prevent clicking
-    if st.session_state.uploaded_file is None:
-        # No file uploaded - show enabled uploader
-        uploaded = st.file_uploader(
-            'Upload a local video or audio file', 
-            type=['mp4','mov','mkv','avi','mp3','wav','m4a'],
-            key='file_uploader_enabled'
-        )
-        if uploaded:
-            st.session_state.uploaded_file = uploaded
-            st.session_state.video_url = ''  # Clear URL when file uploaded
-            st.rerun()
-    else:
-        # File already uploaded - show disabled uploader that displays the file
-        st.file_uploader(
-            'Upload a local video or audio file', 
-            type=['mp4','mov','mkv','avi','mp3','wav','m4a'],
-            disabled=True,
-            key='file_uploader_disabled'
-        )
-        # Show the stored file with option to clear
+    # Single uploader; the callback mirrors it into session state (which
+    # survives switching input methods) and clears any URL
+    st.file_uploader(
+        'Upload a local video or audio file', 
+        type=['mp4','mov','mkv','avi','mp3','wav','m4a'],
+        key='file_uploader',
+        on_change=on_file_uploaded
+    )
+    if st.session_state.uploaded_file is not None and st.session_state.get('file_uploader') is None:
+        # File kept from before switching input methods - show it with option to clear
         col1, col2 = st.columns([4, 1])
         with col1:
             st.info(f"📄 {st.session_state.uploaded_file.name}")
@@ -257,41 +479,26 @@ else:
     if video_url != st.session_state.video_url:
         st.session_state.video_url = video_url
         st.session_state.uploaded_file = None  # Clear file when URL entered
-    
-    if st.session_state.video_url:
-        # Validate URL format
-        from urllib.parse import urlparse
-        try:
-            parsed = urlparse(st.session_state.video_url)
-            is_valid_url = all([parsed.scheme in ['http', 'https'], parsed.netloc])
-        except:
-            is_valid_url = False
-        
-        if not is_valid_url:
-            st.error("⚠️ Invalid URL format. Please enter a valid http:// or https:// URL.")
-        else:
-            # Only show the URL box and clear button if valid
-            col1, col2 = st.columns([4, 1])
-            with col1:
-                st.info(f"🔗 {st.session_state.video_url}")
-            with col2:
-                if st.button("✕", key="clear_url", help="Remove URL"):
-                    st.session_state.video_url = ''
-                    st.rerun()
 
 # Use the file from session state
 uploaded = st.session_state.uploaded_file
 video_url = st.session_state.video_url
 
-# Validate URL if provided
-from urllib.parse import urlparse
-url_is_valid = True
-if video_url and video_url.strip():
-    try:
-        parsed = urlparse(video_url)
-        url_is_valid = all([parsed.scheme in ['http', 'https'], parsed.netloc])
-    except:
-        url_is_valid = False
+# Parse and validate the URL once; reused for display, gating and naming results
+parsed_url, url_is_valid = parse_video_url(video_url)
+
+if input_method == "URL" and video_url:
+    if not url_is_valid:
+        st.error("⚠️ Invalid URL format. Please enter a valid http:// or https:// URL.")
+    else:
+        # Only show the URL box and clear button if valid
+        col1, col2 = st.columns([4, 1])
+        with col1:
+            st.info(f"🔗 {video_url}")
+        with col2:
+            if st.button("✕", key="clear_url", help="Remove URL"):
+                st.session_state.video_url = ''
+                st.rerun()
 
 # Initialize session state for analysis tracking
 if 'analyzing' not in st.session_state:
@@ -301,20 +508,19 @@ if 'analyzing' not in st.session_state:
 if 'analysis_results' not in st.session_state:
     st.session_state.analysis_results = None
 
-# Initialize session state for triggering analysis
-if 'start_analysis' not in st.session_state:
-    st.session_state.start_analysis = False
+# Initialize session state for the background analysis job
+if 'analysis_job' not in st.session_state:
+    st.session_state.analysis_job = None
 
 # Enable analyze button if either file or valid URL is provided AND required fields are filled
-can_analyze = (uploaded is not None or (video_url and video_url.strip() and url_is_valid)) and first_name.strip() and last_name.strip() and partner_name.strip()
+# (isspace() checks blankness without allocating stripped copies)
+has_source = uploaded is not None or (url_is_valid and bool(video_url) and not video_url.isspace())
+names_ok = all(name and not name.isspace() for name in (first_name, last_name, partner_name))
+can_analyze = has_source and names_ok
 
 # Processing options
 st.subheader("⚙️ Processing Options")
 
-# Determine API key validity for providers
-openai_valid = bool(openai_key and openai_key.startswith('sk-') and not openai_key.endswith('your-openai-key-here'))
-anthropic_valid = bool(anthropic_key and anthropic_key.startswith('sk-ant-') and not anthropic_key.endswith('your-anthropic-key-here'))
-
 # Gate OpenAI API option on valid OpenAI key (only OpenAI has Whisper API)
 openai_api_enabled = openai_valid
 
@@ -339,163 +545,169 @@ transcription_method = st.radio(
 translate = st.checkbox('Translate to English', value=True, help='Automatically translate non-English audio to English using Whisper')
 vision = st.checkbox('Enable visual alignment checks')
 
+# Collect a finished background analysis before rendering the button, so the
+# button is re-enabled in the same run
+job = st.session_state.analysis_job
+job_error = None
+if job is not None and job['future'].done():
+    st.session_state.analysis_job = None
+    st.session_state.analyzing = False
+    
+    # Clean up temp file
+    if job['tmp']:
+        try:
+            if os.path.exists(job['tmp']):
+                os.remove(job['tmp'])
+        except Exception:
+            pass
+    
+    try:
+        res = job['future'].result()
+    except Exception as e:
+        job_error = e
+    else:
+        # Create new result dictionary with submitter at the top, and store it
+        # in session state for persistence across reruns
+        st.session_state.analysis_results = {'submitter': job['submitter'], **res}
+        # Identifies this result for the once-per-result work below (id() values get reused)
+        st.session_state.analysis_results_token = uuid.uuid4().hex
+    job = None
+
 # Dynamic button text and disabled state
 button_text = "🚀 Analyzing Video..." if st.session_state.analyzing else "🚀 Analyze Video"
 button_disabled = not can_analyze or st.session_state.analyzing
 
 if st.button(button_text, disabled=button_disabled, use_container_width=True, type="primary"):
-    # Set flags to start analysis
-    st.session_state.start_analysis = True
-    st.session_state.analyzing = True
-    st.rerun()
-
-# Run analysis if start_analysis flag is set
-if st.session_state.start_analysis:
-    # Clear the start_analysis flag
-    st.session_state.start_analysis = False
-    
     # Clear previous results when starting new analysis
     st.session_state.analysis_results = None
     
-    # Warn user about UI unresponsiveness
-    warning_placeholder = st.empty()
-    warning_placeholder.warning("⚠️ **Analysis in progress** - The interface may be slow or unresponsive during processing. This is normal and can take several minutes depending on video length and model used for transcription/translation. Halting the application during analysis may also freeze the console while the processes are gracefully shut down and artifacts are cleaned up.")
+    rubric_filename = rubric_options[selected_rubric_name]
     
-    tmp = None
-    try:
-        prov = AIProvider.OPENAI if provider == 'openai' else AIProvider.ANTHROPIC
-        rubric_filename = rubric_options[selected_rubric_name]
-        
-        # Map friendly name to internal value - "OpenAI Whisper API" uses openai for transcription, "Local Whisper model" uses local
-        method_internal = "openai" if transcription_method == "OpenAI Whisper API" else "local"
-        
-        # Progress callback that prints to terminal (stdout)
-        def progress_callback(message: str):
-            print(message, flush=True)
-        
-        # Show progress with status updates
-        progress_placeholder = st.empty()
-        status_placeholder = st.empty()
-        
-        # Progress callback that updates the UI in real-time
-        def ui_progress_callback(message: str):
-            # Map internal progress messages to UI step numbers
-            if "Downloading from URL" in message:
-                progress_placeholder.write("⏳ **Step 1/4:** Downloading video/audio...")
-            elif "Download complete" in message:
-                progress_placeholder.write("⏳ **Step 2/4:** Transcribing audio with Whisper...")
-            elif "Transcribing audio" in message:
-                # Extract model and device info from message like "🎤 Transcribing audio with Whisper base model on CPU..."
-                if "Whisper" in message and "model" in message:
-                    progress_placeholder.write(f"⏳ **Step 2/4:** {message.replace('🎤 ', '')}")
-                elif "OpenAI API" in message:
-                    progress_placeholder.write("⏳ **Step 2/4:** Transcribing with OpenAI API...")
-                else:
-                    progress_placeholder.write("⏳ **Step 2/4:** Transcribing audio with Whisper model...")
-            elif "Analyzing video frames" in message:
-                progress_placeholder.write("⏳ **Step 3/4:** Analyzing video frames...")
-            elif "Evaluating transcript" in message:
-                progress_placeholder.write("⏳ **Step 3/4:** Evaluating with AI...")
-            elif "Generating qualitative feedback" in message:
-                progress_placeholder.write("⏳ **Step 4/4:** Generating feedback...")
-            # Also print to terminal for debugging
-            print(message, flush=True)
-        
-        evaluator = VideoEvaluator(
-            rubric_path=rubric_filename,
-            api_key=openai_key if provider == 'openai' else anthropic_key,
-            provider=prov, 
-            enable_vision=vision, 
-            verbose=True,  # Back to normal - chunking now works properly
-            progress_callback=ui_progress_callback,
-            translate_to_english=translate,
-            transcription_method=method_internal,
-            openai_api_key=openai_key  # Always pass OpenAI key for Whisper API
+    # Map friendly name to internal value - "OpenAI Whisper API" uses openai for transcription, "Local Whisper model" uses local
+    method_internal = "openai" if transcription_method == "OpenAI Whisper API" else "local"
+    api_key = openai_key if provider == 'openai' else anthropic_key
+    
+    # Progress is written by the worker thread and read by each polling rerun
+    progress = {'step': "⏳ **Step 1/4:** Preparing audio..."}
+    
+    # Progress callback that records the current UI step
+    def ui_progress_callback(message: str):
+        step = progress_step(message)
+        if step:
+            progress['step'] = step
+        # Also print to terminal for debugging
+        print(message, flush=True)
+    
+    def run_analysis(source, is_url):
+        evaluator = get_evaluator(
+            rubric_filename,
+            provider,
+            vision,
+            translate,
+            method_internal,
+            api_key,
+            openai_key,
+            ui_progress_callback
         )
+        try:
+            res = evaluator.process(source, is_url=is_url, enable_vision=vision)
+        finally:
+            # Remove this run's temp directory now rather than whenever the evaluator is collected
+            evaluator._cleanup_temp_dir()
         
-        with status_placeholder.container():
-            progress_placeholder.write("⏳ **Step 1/4:** Preparing audio...")
-            progress_placeholder.caption("This may take a few minutes, depending on audio/video length")
-            
-            # Process based on input type
-            if uploaded:
-                # File upload - save to temp
-                tmp = f"/tmp/{uploaded.name}"
-                with open(tmp, 'wb') as f:
-                    f.write(uploaded.getbuffer())
-                res = evaluator.process(tmp, is_url=False, enable_vision=vision)
-                original_filename = uploaded.name
-            else:
-                # URL - process directly
-                res = evaluator.process(video_url, is_url=True, enable_vision=vision)
-                # Extract filename from URL for results saving
-                from urllib.parse import urlparse
-                import os
-                parsed_url = urlparse(video_url)
-                original_filename = os.path.basename(parsed_url.path) or "video_from_url"
-            
-            # Print completion to terminal
-            print("✅ Analysis complete!", flush=True)
-            print("", flush=True)
-            print("", flush=True)
-        
+        # Print completion to terminal
+        print("✅ Analysis complete!", flush=True)
+        print("", flush=True)
+        print("", flush=True)
+        return res
+    
+    tmp = None
+    if uploaded:
+        # File upload - save to temp (the upload buffer lives in this session,
+        # so copy it before handing off to the worker)
+        # Unique temp name (keeping the extension for format detection) so
+        # concurrent sessions uploading the same filename don't collide
+        uploaded.seek(0)
+        with tempfile.NamedTemporaryFile(delete=False, suffix=Path(uploaded.name).suffix) as f:
+            tmp = f.name
+            # Copy in 1 MiB chunks rather than materializing a second full copy
+            shutil.copyfileobj(uploaded, f, length=1024 * 1024)
+        source, is_url = tmp, False
+        original_filename = uploaded.name
+    else:
+        # URL - process directly
+        source, is_url = video_url, True
+        # Extract filename from URL for results saving
+        original_filename = os.path.basename(parsed_url.path) or "video_from_url"
+    
+    # Run the analysis on a worker thread so the script (and UI) stays live
+    st.session_state.analysis_job = {
+        'future': analysis_executor().submit(
+            run_in_script_context, get_script_run_ctx(), run_analysis, source, is_url
+        ),
+        'progress': progress,
+        'tmp': tmp,
+        'original_filename': original_filename,
         # Reorganize results with submitter information at the top
-        submitter_info = {
+        'submitter': {
             'first_name': first_name.strip(),
             'last_name': last_name.strip(),
             'partner_name': partner_name.strip()
         }
-        
-        # Create new result dictionary with submitter at the top
-        res = {'submitter': submitter_info, **res}
-        
-        # Store results in session state for persistence across reruns
-        st.session_state.analysis_results = res
-        
-        # Reset analyzing state after successful completion
-        st.session_state.analyzing = False
-        
-        # Trigger a rerun to update the button state
-        st.rerun()
-        
-        progress_placeholder.empty()
-        status_placeholder.empty()
-        
-        # Clear the warning message now that analysis is complete
-        warning_placeholder.empty()
+    }
+    st.session_state.analyzing = True
+    
+    # Rerun so the button re-renders in its "Analyzing..." state
+    st.rerun()
 
-        # Display transcription quality first (for reviewer confidence)
-        
-    except FileNotFoundError as e:
-        st.session_state.analyzing = False
-        st.rerun()
-        warning_placeholder.empty()
-        if 'ffmpeg' in str(e).lower():
-            st.error("❌ ffmpeg not found")
-            st.write("ffmpeg is required for video/audio processing.")
-            st.write("Install with:")
-            st.code("brew install ffmpeg", language="bash")
-        else:
-            st.error(f"File not found: {e}")
-    except Exception as e:
-        st.session_state.analyzing = False
-        st.rerun()
-        warning_placeholder.empty()
-        st.error(f"Error processing video: {e}")
-        st.write("Run `run.sh check` to verify all dependencies are installed.")
-    finally:
-        # Clean up temp file
-        if tmp:
-            try:
-                import os
-                if os.path.exists(tmp):
-                    os.remove(tmp)
-            except Exception:
-                pass
+# Show progress of a running analysis, polling until the worker finishes
+if job is not None:
+    analysis_status(job)
+
+if isinstance(job_error, FileNotFoundError):
+    if 'ffmpeg' in str(job_error).lower():
+        st.error("❌ ffmpeg not found")
+        st.write("ffmpeg is required for video/audio processing.")
+        st.write("Install with:")
+        st.code("brew install ffmpeg", language="bash")
+    else:
+        st.error(f"File not found: {job_error}")
+elif job_error is not None:
+    st.error(f"Error processing video: {job_error}")
+    st.write("Run `run.sh check` to verify all dependencies are installed.")
 
 # Display results if available in session state
 if st.session_state.analysis_results is not None:
     res = st.session_state.analysis_results
+    results_token = st.session_state.analysis_results_token
+    
+    # Rubric label/weight maps only change with the rubric or the result, so
+    # build them once rather than on every rerun (e.g. score override clicks)
+    rubric_filename = rubric_options[selected_rubric_name]
+    rubric_maps_key = (rubric_filename, results_token)
+    if st.session_state.get('rubric_maps_key') != rubric_maps_key:
+        rubric_maps = load_rubric_maps(rubric_filename)
+        result_scores = res.get('evaluation', {}).get('scores', {})
+        result_categories = res.get('evaluation', {}).get('categories', {})
+        # Give ids missing from the rubric a readable label up front, so the
+        # render loops are plain lookups
+        for criterion_id in result_scores:
+            rubric_maps['criterion_labels'].setdefault(criterion_id, criterion_id.replace('_', ' ').title())
+        for cat_id in result_categories:
+            rubric_maps['category_labels'].setdefault(cat_id, cat_id.replace('_', ' ').title())
+        rubric_maps['fallback_criteria'] = [
+            rubric_maps['criterion_labels'][criterion_id]
+            for criterion_id, data in result_scores.items()
+            if 'Auto-generated conservative score' in data.get('note', '')
+        ]
+        rubric_maps['confidence_by_criterion'] = {
+            criterion_id: data['confidence']
+            for criterion_id, data in result_scores.items()
+            if isinstance(data.get('confidence'), int)
+        }
+        st.session_state.rubric_maps = rubric_maps
+        st.session_state.rubric_maps_key = rubric_maps_key
+    rubric_maps = st.session_state.rubric_maps
     
     quality = res.get('quality', {})
     if quality:
@@ -548,23 +760,11 @@ if st.session_state.analysis_results is not None:
         # Visual Analysis (if enabled) - placed right after transcription quality
         if res.get('visual_analysis'):
             visual_text = res.get('visual_analysis', '')
-            # Determine if mismatches were detected
-            visual_lower = visual_text.lower()
-            
-            # If text contains "no mismatch" or "no clear mismatch", it's clean
-            # Otherwise look for problem indicators
-            if 'no mismatch' in visual_lower or 'no clear mismatch' in visual_lower:
-                has_mismatch = False
-            else:
-                # Look for actual problem indicators
-                has_mismatch = any(phrase in visual_lower for phrase in [
-                    'mismatch detected',
-                    'does not match',
-                    'not visible',
-                    'inconsistent',
-                    'contradiction',
-                    'discrepancy'
-                ])
+            # Determine if mismatches were detected (once per result)
+            if st.session_state.get('visual_mismatch_key') != results_token:
+                st.session_state.visual_mismatch = has_visual_mismatch(visual_text)
+                st.session_state.visual_mismatch_key = results_token
+            has_mismatch = st.session_state.visual_mismatch
             
             status_message = "Mismatches detected" if has_mismatch else "No mismatches detected"
             
@@ -596,122 +796,57 @@ if st.session_state.analysis_results is not None:
         
         # Display category scores for new format
         if is_new_format and 'categories' in evaluation:
-            # Load the rubric to get proper labels
-            rubric_filename = rubric_options[selected_rubric_name]
-            rubric_path = Path(__file__).parent.parent / "rubrics" / f"{rubric_filename}.json"
-            rubric_data = {}
-            try:
-                with open(rubric_path, 'r') as f:
-                    rubric_data = json.load(f)
-            except:
-                pass
-            
-            # Create category label mapping
-            category_labels = {}
-            category_weights = {}
-            if rubric_data and "categories" in rubric_data:
-                for category in rubric_data["categories"]:
-                    category_labels[category["category_id"]] = category["label"]
-                    category_weights[category["category_id"]] = category.get("weight", 0)
+            category_labels = rubric_maps['category_labels']
+            category_weights = rubric_maps['category_weights']
+            category_criteria = rubric_maps['category_criteria']
+            confidence_by_criterion = rubric_maps['confidence_by_criterion']
             
             st.markdown("### 📂 Category Breakdown")
             categories = evaluation.get('categories', {})
             scores = evaluation.get('scores', {})
             
             # Check if any scores are fallback (heuristic) and show prominent warning
-            fallback_criteria = []
-            
-            # Create criterion label mapping for fallback detection
-            temp_criterion_labels = {}
-            if rubric_data:
-                if "categories" in rubric_data:
-                    # New format
-                    for category in rubric_data["categories"]:
-                        for criterion in category["criteria"]:
-                            temp_criterion_labels[criterion["criterion_id"]] = criterion["label"]
-                else:
-                    # Old format
-                    for criterion in rubric_data["criteria"]:
-                        temp_criterion_labels[criterion["id"]] = criterion["label"]
-            
-            for criterion_id, data in scores.items():
-                note = data.get('note', '')
-                if 'Auto-generated conservative score' in note:
-                    fallback_criteria.append(temp_criterion_labels.get(criterion_id, criterion_id))
-            
+            fallback_criteria = rubric_maps['fallback_criteria']
             if fallback_criteria:
                 st.error("🚨 **AI Evaluation Failed** - Using Conservative Fallback Scores")
                 st.warning("The AI API calls failed, so we're using automatic scoring instead of AI evaluation. This may not reflect the true quality of the video. Please check your API key credits and connection.")
                 st.info(f"**Affected criteria:** {', '.join(fallback_criteria)}")
                 st.markdown("---")
             
-            # Create mapping of criteria to categories
-            category_criteria = {}
-            if rubric_data and "categories" in rubric_data:
-                for category in rubric_data["categories"]:
-                    category_criteria[category["category_id"]] = [
-                        criterion["criterion_id"] for criterion in category["criteria"]
-                    ]
-            
-            # Create table headers
-            col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
-            with col1:
-                st.markdown("**Name**")
-            with col2:
-                st.markdown("**Score**")
-            with col3:
-                st.markdown("**Weight**")
-            with col4:
-                st.markdown("**Confidence**")
-            
+            # Build all rows first and render them as a single table
+            category_rows = []
             for cat_id, cat_data in categories.items():
-                cat_name = category_labels.get(cat_id, cat_id.replace('_', ' ').title())
+                cat_name = category_labels[cat_id]
                 points = cat_data.get('points', 0)
                 max_points = cat_data.get('max_points', 0)
                 percentage = cat_data.get('percentage', 0)
                 weight = category_weights.get(cat_id, 0)
                 
                 # Calculate average confidence for this category
-                category_confidences = []
-                if cat_id in category_criteria:
-                    for criterion_id in category_criteria[cat_id]:
-                        if criterion_id in scores:
-                            confidence = scores[criterion_id].get('confidence')
-                            if isinstance(confidence, int):
-                                category_confidences.append(confidence)
-                
-                avg_confidence = None
-                if category_confidences:
-                    avg_confidence = sum(category_confidences) / len(category_confidences)
+                category_confidences = [
+                    confidence_by_criterion[criterion_id]
+                    for criterion_id in category_criteria.get(cat_id, ())
+                    if criterion_id in confidence_by_criterion
+                ]
+                avg_confidence = sum(category_confidences) / len(category_confidences) if category_confidences else None
                 
                 # Determine confidence text label (High/Medium/Low)
                 if avg_confidence is not None:
-                    if avg_confidence >= 8:
-                        confidence_display = f"High ({avg_confidence:.1f}/10)"
-                    elif avg_confidence >= 6:
-                        confidence_display = f"Medium ({avg_confidence:.1f}/10)"
-                    else:
-                        confidence_display = f"Low ({avg_confidence:.1f}/10)"
+                    confidence_display = f"{confidence_label(avg_confidence)} ({avg_confidence:.1f}/10)"
                 else:
                     confidence_display = "N/A"
                 
                 # Determine score stoplight based on percentage
-                if percentage >= 80:
-                    score_icon = "🟢"
-                elif percentage >= 60:
-                    score_icon = "🟡"
-                else:
-                    score_icon = "🔴"
+                score_icon = score_icon_for(percentage)
                 
-                col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
-                with col1:
-                    st.markdown(f"**{cat_name}**")
-                with col2:
-                    st.markdown(f"{score_icon} **{points}/{max_points}** ({percentage:.1f}%)")
-                with col3:
-                    st.markdown(f"**{weight:.1f}**")
-                with col4:
-                    st.markdown(confidence_display)
+                category_rows.append({
+                    'Name': cat_name,
+                    'Score': f"{score_icon} {points}/{max_points} ({percentage:.1f}%)",
+                    'Weight': f"{weight:.1f}",
+                    'Confidence': confidence_display,
+                })
+            
+            render_table(category_rows)
         
         # Display qualitative feedback
         feedback = res.get('feedback')
@@ -721,17 +856,14 @@ if st.session_state.analysis_results is not None:
             
             st.subheader(f'{tone_emoji} Feedback for Submitter')
             
-            # Check if feedback is fallback-generated
-            is_fallback_feedback = False
-            strengths = feedback.get('strengths', [])
-            improvements = feedback.get('improvements', [])
+            strengths = normalize_feedback_items(feedback.get('strengths', []), 'Strength')
+            improvements = normalize_feedback_items(feedback.get('improvements', []), 'Area for improvement')
             
-            # Check for generic fallback patterns in feedback
-            for item in strengths + improvements:
-                desc = item.get('description', '')
-                if 'You scored' in desc and ('Good performance in this area.' in desc or 'Consider focusing on improving this aspect.' in desc):
-                    is_fallback_feedback = True
-                    break
+            # Check if feedback is fallback-generated (generic patterns in any item)
+            is_fallback_feedback = any(
+                is_fallback_description(description)
+                for _, description in chain(strengths, improvements)
+            )
             
             if is_fallback_feedback:
                 st.warning("🤖 **AI Feedback Generation Failed** - Using generic feedback based on scores")
@@ -739,125 +871,103 @@ if st.session_state.analysis_results is not None:
             
             # Strengths
             st.markdown("### ✓ Strengths")
-            for i, strength in enumerate(strengths, 1):
-                with st.expander(f"**{strength.get('title', 'Strength')}**", expanded=True):
-                    st.write(strength.get('description', ''))
+            if strengths:
+                st.markdown(feedback_items_markdown(strengths), unsafe_allow_html=True)
             
             # Areas for improvement
             st.markdown("### → Areas for Improvement")
-            for i, improvement in enumerate(improvements, 1):
-                with st.expander(f"**{improvement.get('title', 'Area for improvement')}**", expanded=True):
-                    st.write(improvement.get('description', ''))
+            if improvements:
+                st.markdown(feedback_items_markdown(improvements), unsafe_allow_html=True)
 
         # Display detailed scores table
         scores = evaluation.get('scores', {})
         if scores:
-            # Load the rubric to get proper labels
-            rubric_filename = rubric_options[selected_rubric_name]
-            rubric_path = Path(__file__).parent.parent / "rubrics" / f"{rubric_filename}.json"
-            rubric_data = {}
-            try:
-                with open(rubric_path, 'r') as f:
-                    rubric_data = json.load(f)
-            except:
-                pass
-            
-            # Create criterion label mapping
-            criterion_labels = {}
-            if rubric_data:
-                if "categories" in rubric_data:
-                    # New format
-                    for category in rubric_data["categories"]:
-                        for criterion in category["criteria"]:
-                            criterion_labels[criterion["criterion_id"]] = criterion["label"]
-                else:
-                    # Old format
-                    for criterion in rubric_data["criteria"]:
-                        criterion_labels[criterion["id"]] = criterion["label"]
+            criterion_labels = rubric_maps['criterion_labels']
             
             with st.expander("### 📋 Detailed Criteria Scores", expanded=False):
-                # Create table headers
-                col1, col2, col3, col4 = st.columns([3, 1, 1, 2])
-                with col1:
-                    st.markdown("**Criterion**")
-                with col2:
-                    st.markdown("**Score**")
-                with col3:
-                    st.markdown("**Confidence**")
-                with col4:
-                    st.markdown("**Notes**")
-                
-                st.markdown("---")  # Divider line
-                
-                # Display each criterion in table format
+                # Build all rows first and render them as a single table
+                criteria_rows = []
+                # Determine max score suffix based on rubric format (same for every row)
+                score_suffix = "" if is_new_format else "/10"
+                score_overrides = st.session_state.score_overrides
                 for criterion_id, data in scores.items():
-                    criterion_name = criterion_labels.get(criterion_id, criterion_id.replace('_', ' ').title())
+                    criterion_name = criterion_labels[criterion_id]
                     original_score = data.get('score', 'N/A')
                     
                     # Check for override
-                    override_key = f"override_{criterion_id}"
-                    if override_key in st.session_state.score_overrides and st.session_state.score_overrides[override_key]['enabled']:
-                        score = st.session_state.score_overrides[override_key]['score']
-                        score_display_base = f"{score}"
-                        if not is_new_format:
-                            score_display_base += "/10"
-                        score_display = f"**{score_display_base}** ⚠️ (Overridden from {original_score})"
+                    override = score_overrides.get(f"override_{criterion_id}")
+                    if override and override['enabled']:
+                        score = override['score']
+                        score_display = f"{score}{score_suffix} ⚠️ (Overridden from {original_score})"
                     else:
                         score = original_score
-                        # Determine max score based on rubric format
-                        if is_new_format:
-                            score_display = f"**{score}**"
-                        else:
-                            score_display = f"**{score}/10**"
+                        score_display = f"{score}{score_suffix}"
                     
                     confidence = data.get('confidence', 'N/A')
                     note = data.get('note', '')
                     
                     # Determine confidence level and color
                     if isinstance(confidence, int):
-                        if confidence >= 8:
-                            confidence_display = f"🟢 {confidence}/10"
-                        elif confidence >= 6:
-                            confidence_display = f"🟡 {confidence}/10"
-                        else:
-                            confidence_display = f"🔴 {confidence}/10"
+                        confidence_display = f"{confidence_icon_for(confidence)} {confidence}/10"
                     else:
                         confidence_display = "N/A"
                     
-                    # Use columns for table-like display
-                    col1, col2, col3, col4 = st.columns([3, 1, 1, 2])
-                    with col1:
-                        st.markdown(f"**{criterion_name}**")
-                    with col2:
-                        st.markdown(score_display)
-                    with col3:
-                        st.markdown(confidence_display)
-                    with col4:
-                        st.caption(note if note else "—")
+                    criteria_rows.append({
+                        'Criterion': criterion_name,
+                        'Score': score_display,
+                        'Confidence': confidence_display,
+                        'Notes': note if note else "—",
+                    })
+                
+                render_table(criteria_rows)
 
         st.subheader('Transcript')
-        with st.expander("**View Full Transcript**", expanded=False):
-            st.text(res.get('transcript', ''))
+        # Only send the (potentially very long) transcript to the browser on request
+        if st.checkbox("**View Full Transcript**", key='show_transcript'):
+            st.text_area(
+                "Transcript",
+                value=res.get('transcript', ''),
+                height=300,
+                disabled=True,
+                label_visibility='collapsed'
+            )
 
         with st.expander("**View Full JSON Results**", expanded=False):
             st.json(res)
         
-        # Save results to file with new naming format
-        from datetime import datetime
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        result_filename = f"{first_name.strip()}_{last_name.strip()}_{partner_name.strip()}_{timestamp}"
-        saved_json_path = save_results(res, result_filename, output_format='json')
+        # Save results to file with new naming format. Write the file once per
+        # result, off the script thread, so the page renders without waiting
+        # on disk; the timestamped name is fixed at that point too
+        if st.session_state.get('saved_results_key') != results_token:
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
+            st.session_state.result_filename = f"{first_name.strip()}_{last_name.strip()}_{partner_name.strip()}_{timestamp}"
+            st.session_state.saved_results_future = results_writer().submit(
+                save_results, res, st.session_state.result_filename, output_format='json'
+            )
+            st.session_state.saved_results_key = results_token
+        result_filename = st.session_state.result_filename
+        save_future = st.session_state.saved_results_future
         
         # Show success message and provide download button
-        st.success(f"💾 Results saved to `results/` folder")
+        if save_future.done() and save_future.exception() is not None:
+            st.error(f"Failed to save results: {save_future.exception()}")
+        else:
+            st.success(f"💾 Results saved to `results/` folder")
         
         # Create centered download button for JSON version
         col1, col2, col3 = st.columns([1, 2, 1])
         with col2:
-            json_content = json.dumps(res, indent=2)
+            # Serve the file already written to results/ instead of encoding
+            # it again; read it once per result rather than on every rerun
+            if st.session_state.get('results_json_key') != results_token:
+                try:
+                    st.session_state.results_json = Path(save_future.result()).read_bytes()
+                except Exception:
+                    st.session_state.results_json = json_dumps(res)
+                st.session_state.results_json_key = results_token
             st.download_button(
                 label="📄 Download JSON Report",
-                data=json_content,
+                data=st.session_state.results_json,
                 file_name=f"{result_filename}_results.json",
                 mime="application/json",
                 use_container_width=True
@@ -4,27 +4,367 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 import streamlit as st
+import pandas as pd
 from pathlib import Path
-import json
+import pickle
+from itertools import cycle
 from rubric_helper import (
     list_available_rubrics, load_rubric_from_file, validate_rubric,
     list_rubric_versions, restore_rubric_version, show_rubric_details,
-    save_rubric_to_file, increment_version, get_rubrics_dir
+    save_rubric_to_file, backup_rubric_file, increment_version, get_rubrics_dir
 )
 from validation_ui import validate_and_display
+from rubric_cache import rubrics_signature, cached_rubric_list, load_rubric
+
+def rubric_file_mtime(filename):
+    """Modification time of a rubric file (ns), or None if it can't be read."""
+    try:
+        return (get_rubrics_dir() / f"{filename}.json").stat().st_mtime_ns
+    except OSError:
+        return None
+
+def working_rubric(filename):
+    """Return the in-progress copy of a rubric, loading it from disk only when needed.
+
+    Structural edits are applied to this copy across reruns; it is dropped
+    (see discard_working_rubric) once the rubric is saved or deleted, and
+    reloaded if the file changes on disk (e.g. a version restore).
+
+    Returns:
+        Tuple of (rubric, error_message), as load_rubric_from_file
+    """
+    key = f"rubric:{filename}"
+    mtime = rubric_file_mtime(filename)
+    if key in st.session_state and st.session_state[key][1] != mtime:
+        discard_working_rubric(filename)
+        st.info("ℹ️ This rubric was changed outside this page; showing the saved version.")
+    if key not in st.session_state:
+        rubric_data, error = load_rubric(filename)
+        if error or rubric_data is None:
+            return rubric_data, error
+        st.session_state[key] = (rubric_data, mtime)
+    return st.session_state[key][0], None
+
+def discard_working_rubric(filename):
+    """Drop the in-progress copy (and its undo state) so the next rerun reads the file from disk."""
+    for key in (f"rubric:{filename}", f"undo:{filename}", f"pending_ops:{filename}"):
+        st.session_state.pop(key, None)
+    bump_editor_revision(filename)
+
+def editor_revision(filename):
+    """Suffix for the table editors' widget keys.
+
+    A keyed data_editor keeps its cell edits across reruns; bumping the
+    revision gives the editors fresh keys so stale edits are dropped.
+    """
+    return st.session_state.get(f"editor_rev:{filename}", 0)
+
+def bump_editor_revision(filename):
+    """Drop the table editors' cell edits (see editor_revision)."""
+    st.session_state[f"editor_rev:{filename}"] = editor_revision(filename) + 1
+
+# Placeholder names that don't imply sequence
+CRITERION_PLACEHOLDERS = ("New Criterion", "Custom Criterion", "Assessment Item", "Evaluation Point", "Quality Measure")
 
 def renumber_criteria(categories):
     """Reset criterion labels within categories to placeholder names that encourage customization."""
-    # Placeholder names that don't imply sequence
-    criterion_placeholders = ["New Criterion", "Custom Criterion", "Assessment Item", "Evaluation Point", "Quality Measure"]
-    
     for cat in categories:
-        criteria = cat.get('criteria', [])
-        for j, crit in enumerate(criteria):
-            # Cycle through placeholder names
-            placeholder = criterion_placeholders[j % len(criterion_placeholders)]
+        # Cycle through placeholder names
+        for crit, placeholder in zip(cat.get('criteria', []), cycle(CRITERION_PLACEHOLDERS)):
             crit['label'] = placeholder
 
+CATEGORY_PLACEHOLDERS = ("New Category", "Custom Category", "Evaluation Area", "Assessment Category")
+
+def queue_structure_op(filename, *op):
+    """Button callback: queue a structural edit to a rubric, applied on the next run."""
+    st.session_state.setdefault(f"pending_ops:{filename}", []).append(op)
+
+def apply_structure_ops(filename, rubric_data):
+    """Apply the rubric's queued structural edits in a single pass.
+
+    Each edit snapshots the rubric (as pickled bytes) first so 'Undo Last
+    Change' can revert it. Queued edits and the undo snapshot are kept per
+    rubric, so they never carry over to another selection.
+
+    Returns:
+        List of status messages for the applied edits
+    """
+    messages = []
+    undo_key = f"undo:{filename}"
+    for op, *args in st.session_state.pop(f"pending_ops:{filename}", []):
+        if op == 'undo':
+            if undo_key in st.session_state:
+                snapshot, action = st.session_state.pop(undo_key)
+                rubric_data.clear()
+                rubric_data.update(pickle.loads(snapshot))
+                messages.append(f"✅ Undid: {action.replace('_', ' ').title()}")
+            continue
+
+        # Create backup for undo, kept as a compact serialized snapshot
+        snapshot = pickle.dumps(rubric_data, protocol=5)
+        categories = rubric_data.setdefault('categories', [])
+
+        if op == 'add_category':
+            action = 'add_category'
+            # Use varied placeholder names to encourage customization
+            placeholder = CATEGORY_PLACEHOLDERS[len(categories) % len(CATEGORY_PLACEHOLDERS)]
+            categories.append({
+                'category_id': f'category_{len(categories)+1}',
+                'label': placeholder,
+                'weight': 0.0,
+                'max_points': 10,
+                'criteria': [{
+                    'criterion_id': 'criterion_1',
+                    'label': 'New Criterion',
+                    'desc': '',
+                    'max_points': 5
+                }]
+            })
+            messages.append("✅ Category added!")
+        elif op == 'reset_labels':
+            action = 'reset_labels'
+            renumber_criteria(categories)
+            messages.append("✅ Labels reset successfully!")
+        elif op == 'add_criterion':
+            i, = args
+            cat = categories[i]
+            action = f'add_criterion_to_{cat.get("label", f"category_{i+1}")}'
+            criteria = cat.setdefault('criteria', [])
+            # Use varied placeholder names to encourage customization
+            placeholder = CRITERION_PLACEHOLDERS[len(criteria) % len(CRITERION_PLACEHOLDERS)]
+            criteria.append({
+                'criterion_id': f'criterion_{len(criteria)+1}',
+                'label': placeholder,
+                'desc': '',
+                'max_points': 5
+            })
+            messages.append("✅ Criterion added!")
+        elif op == 'remove_category':
+            i, = args
+            cat = categories.pop(i)
+            action = f'remove_category_{cat.get("label", f"category_{i+1}")}'
+            messages.append("✅ Category removed!")
+        elif op == 'remove_criterion':
+            i, j = args
+            criterion = categories[i]['criteria'].pop(j)
+            action = f'remove_criterion_{criterion.get("label", f"criterion_{j+1}")}'
+            renumber_criteria(categories)
+            messages.append("✅ Criterion removed!")
+        else:
+            continue
+        st.session_state[undo_key] = (snapshot, action)
+    return messages
+
+def categories_frame(categories):
+    """Editable table of category fields, one row per category."""
+    return pd.DataFrame(
+        [{'label': cat.get('label', ''), 'category_id': cat.get('category_id', ''),
+          'weight': float(cat.get('weight', 0.0)), 'max_points': int(cat.get('max_points', 10))}
+         for cat in categories],
+        columns=['label', 'category_id', 'weight', 'max_points']
+    )
+
+def criteria_frame(categories):
+    """Editable table of criterion fields, one row per criterion in category order."""
+    return pd.DataFrame(
+        [{'category': cat.get('label', ''), 'label': crit.get('label', ''), 'criterion_id': crit.get('criterion_id', ''),
+          'max_points': int(crit.get('max_points', 5)), 'desc': crit.get('desc', '')}
+         for cat in categories for crit in cat.get('criteria', [])],
+        columns=['category', 'label', 'criterion_id', 'max_points', 'desc']
+    )
+
+def _cell_text(value):
+    """Cleared text cells come back as None/NaN; treat them as empty strings."""
+    return '' if pd.isna(value) else str(value)
+
+def apply_category_edits(categories, edited):
+    """Write an edited categories table back into the rubric (rows match categories by position)."""
+    for cat, row in zip(categories, edited.itertuples(index=False)):
+        cat['label'] = _cell_text(row.label)
+        cat['category_id'] = _cell_text(row.category_id)
+        cat['weight'] = 0.0 if pd.isna(row.weight) else float(row.weight)
+        cat['max_points'] = cat.get('max_points', 10) if pd.isna(row.max_points) else int(row.max_points)
+
+def apply_criteria_edits(categories, edited):
+    """Write an edited criteria table back into the rubric (rows in criteria_frame order)."""
+    all_criteria = [crit for cat in categories for crit in cat.get('criteria', [])]
+    for crit, row in zip(all_criteria, edited.itertuples(index=False)):
+        crit['label'] = _cell_text(row.label)
+        crit['criterion_id'] = _cell_text(row.criterion_id)
+        crit['max_points'] = crit.get('max_points', 5) if pd.isna(row.max_points) else int(row.max_points)
+        crit['desc'] = _cell_text(row.desc)
+
+def rubric_stats(rubric_data):
+    """Summary totals for a rubric, gathered in a single pass over its categories."""
+    stats = {'total_categories': 0, 'total_criteria': 0, 'total_points': 0, 'total_weight': 0, 'max_score': 0}
+    for cat in rubric_data.get('categories', []):
+        criteria = cat.get('criteria', [])
+        stats['total_categories'] += 1
+        stats['total_criteria'] += len(criteria)
+        stats['total_points'] += cat.get('max_points', 0)
+        stats['total_weight'] += cat.get('weight', 0)
+        for crit in criteria:
+            stats['max_score'] += crit.get('max_points', 0)
+    return stats
+
+def threshold_percentages(rubric_data):
+    """Pass and resubmit thresholds as percentages of the rubric's max score.
+
+    Returns:
+        Tuple of (pass_pct, revise_pct), both None if the rubric has no positive max score
+    """
+    thresholds = rubric_data.get('thresholds') or {}
+    scale_max = (rubric_data.get('scale') or {}).get('max', 10)
+    if not scale_max or scale_max <= 0:
+        return None, None
+    return thresholds.get('pass', 7) / scale_max * 100, thresholds.get('revise', 5) / scale_max * 100
+
+@st.fragment
+def edit_rubric_form(rubric_name, rubric_data, is_new_format, stats, threshold_pcts):
+    """Render the main edit form.
+
+    Runs as a fragment, so submitting the form (e.g. a save that fails
+    validation) reruns only the form rather than the whole page.
+    """
+    # Main editing form with tabs (Recommendations #2, #3, #4)
+    with st.form(f"edit_rubric_form_{rubric_name}"):
+        # Form tabs for progressive disclosure
+        form_tab1, form_tab2, form_tab3 = st.tabs(["📝 Basic Info", "🎯 Scoring Thresholds", "📂 Categories & Criteria"])
+
+        with form_tab1:
+            col1, col2 = st.columns(2)
+            with col1:
+                name = st.text_input("Rubric Name", value=rubric_data.get('name', ''),
+                                   help="Display name for the rubric")
+                version = st.text_input("Version", value=rubric_data.get('version', '1.0'),
+                                      help="Current version (auto-incremented when saved)", disabled=True)
+            with col2:
+                rubric_id = st.text_input("Rubric ID", value=rubric_data.get('rubric_id', ''),
+                                        help="Unique identifier (read-only)", disabled=True)
+                # Max score calculated from criteria
+                st.number_input("Maximum Score (Calculated)", min_value=0, value=stats['max_score'],
+                              disabled=True, help="Automatically calculated from all criteria points", key="edit_max_score_display")
+
+            description = st.text_area("Description", value=rubric_data.get('description', ''),
+                                     help="Brief description of what this rubric evaluates", height=100)
+
+        with form_tab2:
+            st.info("Set the percentage thresholds for pass/fail decisions.")
+
+            current_pass_pct, current_revise_pct = threshold_pcts
+            col1, col2 = st.columns(2)
+            with col1:
+                pass_threshold_pct = st.number_input("Pass Threshold (%)", min_value=0, max_value=100, step=1,
+                                                   value=int(current_pass_pct) if current_pass_pct is not None else 70,
+                                                   help="Percentage score required to pass")
+            with col2:
+                revise_threshold_pct = st.number_input("Resubmit Threshold (%)", min_value=0, max_value=100, step=1,
+                                                     value=int(current_revise_pct) if current_revise_pct is not None else 50,
+                                                     help="Minimum score to allow video resubmission")
+
+        with form_tab3:
+            edited_categories = edited_criteria = None
+            if is_new_format:
+                st.info("Edit the content and details of existing categories and criteria.")
+
+                categories = rubric_data.get('categories', [])
+                if categories:
+                    col1, col2, col3 = st.columns(3)
+                    with col1:
+                        st.metric("Total Categories", stats['total_categories'])
+                        st.caption(f"Total weight: {stats['total_weight']:.3f} (should be 1.0)")
+                    with col2:
+                        st.metric("Total Criteria", stats['total_criteria'])
+                    with col3:
+                        st.metric("Total Points", stats['total_points'])
+
+                    # Categories and criteria are edited as two tables rather
+                    # than several widgets per row
+                    st.markdown("**Categories**")
+                    edited_categories = st.data_editor(
+                        categories_frame(categories),
+                        key=f"edit_categories_{rubric_name}_{editor_revision(rubric_name)}",
+                        hide_index=True,
+                        use_container_width=True,
+                        column_config={
+                            'label': st.column_config.TextColumn("Category Label", required=True),
+                            'category_id': st.column_config.TextColumn("Category ID", required=True),
+                            'weight': st.column_config.NumberColumn("Weight", min_value=0.0, max_value=1.0, step=0.01, format="%.3f"),
+                            'max_points': st.column_config.NumberColumn("Max Points", min_value=1, step=1),
+                        }
+                    )
+
+                    st.markdown("**Criteria**")
+                    edited_criteria = st.data_editor(
+                        criteria_frame(categories),
+                        key=f"edit_criteria_{rubric_name}_{editor_revision(rubric_name)}",
+                        hide_index=True,
+                        use_container_width=True,
+                        disabled=['category'],
+                        column_config={
+                            'category': st.column_config.TextColumn("Category"),
+                            'label': st.column_config.TextColumn("Label", required=True),
+                            'criterion_id': st.column_config.TextColumn("ID", required=True),
+                            'max_points': st.column_config.NumberColumn("Points", min_value=1, step=1),
+                            'desc': st.column_config.TextColumn("Description", width="large"),
+                        }
+                    )
+                else:
+                    st.info("No categories found. Add Categories and Criteria with the button below.")
+            else:
+                st.warning("⚠️ Legacy format rubric - only basic info and thresholds can be edited. Convert to new format for full editing capabilities.")
+
+        # Submit button (Recommendation #5 - unified action)
+        submitted = st.form_submit_button("💾 Save All Changes", use_container_width=True, type="primary")
+
+        if submitted:
+            # Update the rubric data
+            rubric_data['name'] = name.strip()
+            rubric_data['description'] = description.strip()
+            rubric_data['rubric_id'] = rubric_id.strip()
+            rubric_data['version'] = version.strip()
+
+            # Table edits are only written back on submit, so they can't
+            # override later structural edits or an undo
+            if edited_categories is not None:
+                apply_category_edits(rubric_data['categories'], edited_categories)
+                apply_criteria_edits(rubric_data['categories'], edited_criteria)
+
+            # Recalculate max score from criteria (the form may have changed their points)
+            calculated_max_score = rubric_stats(rubric_data)['max_score']
+            rubric_data['scale']['max'] = calculated_max_score
+
+            # Convert percentage thresholds to absolute values
+            pass_threshold = int((pass_threshold_pct / 100.0) * calculated_max_score)
+            revise_threshold = int((revise_threshold_pct / 100.0) * calculated_max_score)
+            rubric_data['thresholds']['pass'] = pass_threshold
+            rubric_data['thresholds']['revise'] = revise_threshold
+
+            # Validate the updated rubric
+            is_valid = validate_and_display(rubric_data, name, mode="inline")
+            if is_valid:
+                # Auto-increment version for new-format rubrics
+                if is_new_format:
+                    current_version = rubric_data.get('version', '1.0')
+                    new_version = increment_version(current_version)
+                    rubric_data['version'] = new_version
+                    st.info(f"📈 Version incremented: {current_version} → {new_version}")
+
+                # Save the rubric
+                success, error = save_rubric_to_file(rubric_data, rubric_name)
+                if success:
+                    st.success(f"✅ Rubric '{name}' updated successfully!")
+                    # Celebrate only the first save of the session
+                    if not st.session_state.get('celebrated'):
+                        st.balloons()
+                        st.session_state['celebrated'] = True
+                    # Reload from disk (this also clears the undo state)
+                    discard_working_rubric(rubric_name)
+                    st.rerun()
+                else:
+                    st.error(f"❌ Error saving rubric: {error}")
+
+
 st.set_page_config(
     page_title="📋 View & Edit Rubric - AI Video Analyzer",
     page_icon="📋",
@@ -34,7 +374,7 @@ st.set_page_config(
 st.title("📋 View & Edit Rubric")
 st.markdown("View rubric details or edit existing evaluation rubrics.")
 
-available_rubrics = list_available_rubrics()
+available_rubrics = cached_rubric_list(rubrics_signature())
 
 if not available_rubrics:
     st.warning("No rubrics available to view or edit.")
@@ -46,10 +386,10 @@ else:
     default_index = 0
     if 'auto_select_rubric' in st.session_state:
         # Auto-select the specified rubric
-        rubric_name = st.session_state['auto_select_rubric']
-        available_filenames = [r['filename'] for r in available_rubrics]
-        if rubric_name in available_filenames:
-            default_index = available_filenames.index(rubric_name) + 1  # +1 because of empty option
+        filename_to_index = {r['filename']: i for i, r in enumerate(available_rubrics)}
+        index = filename_to_index.get(st.session_state['auto_select_rubric'])
+        if index is not None:
+            default_index = index + 1  # +1 because of empty option
         else:
             # Clear invalid auto-select state
             del st.session_state['auto_select_rubric']
@@ -62,26 +402,27 @@ else:
     )
 
     if rubric_name:
-        # Load the rubric data
-        rubric_data, error = load_rubric_from_file(rubric_name)
+        # Load the rubric data (kept in session state while it is being edited)
+        rubric_data, error = working_rubric(rubric_name)
         if error:
             st.error(f"Error loading rubric: {error}")
         elif rubric_data is None:
             st.error(f"Rubric '{rubric_name}' not found.")
         else:
+            # Apply structural edits queued by the buttons below, before rendering
+            structure_messages = apply_structure_ops(rubric_name, rubric_data)
+            if structure_messages:
+                # Rows may have moved; drop any cell edits made against the old layout
+                bump_editor_revision(rubric_name)
+
             # Check if it's a new format rubric
             is_new_format = "categories" in rubric_data
             if not is_new_format:
                 st.warning("⚠️ This rubric uses the legacy format (flat criteria). The edit form supports the new hierarchical format. You can still edit basic info and thresholds.")
 
             # Calculate summary statistics for both View and Edit tabs
-            if 'categories' in rubric_data:
-                total_categories = len(rubric_data['categories'])
-                total_criteria = sum(len(cat['criteria']) for cat in rubric_data['categories'])
-                total_points = sum(cat['max_points'] for cat in rubric_data['categories'])
-                total_weight = sum(cat.get('weight', 0) for cat in rubric_data['categories'])
-            else:
-                total_categories = total_criteria = total_points = total_weight = 0
+            stats = rubric_stats(rubric_data)
+            pass_pct, revise_pct = threshold_percentages(rubric_data)
 
             # Add tabs for View and Edit modes
             tab1, tab2 = st.tabs(["👁️ View", "✏️ Edit"])
@@ -96,26 +437,20 @@ else:
                 with col1:
                     st.metric("Version", rubric_data.get('version', 'N/A'))
                 with col2:
-                    thresholds = rubric_data.get('thresholds', {})
-                    max_score = rubric_data.get('scale', {}).get('max', 10)
-                    pass_threshold_pct = (thresholds.get('pass', 7) / max_score * 100) if max_score > 0 else 0
-                    st.metric("Pass Threshold", f"≥{pass_threshold_pct:.0f}%")
+                    st.metric("Pass Threshold", f"≥{pass_pct or 0:.0f}%")
                 with col3:
-                    thresholds = rubric_data.get('thresholds', {})
-                    max_score = rubric_data.get('scale', {}).get('max', 10)
-                    resubmit_threshold_pct = (thresholds.get('revise', 5) / max_score * 100) if max_score > 0 else 0
-                    st.metric("Resubmit Threshold", f"≥{resubmit_threshold_pct:.0f}%")
+                    st.metric("Resubmit Threshold", f"≥{revise_pct or 0:.0f}%")
                     st.caption("Minimum score to allow video resubmission")
 
                 # Show structure info
                 if 'categories' in rubric_data:
                     col1, col2, col3 = st.columns(3)
                     with col1:
-                        st.metric("Total Categories", total_categories)
+                        st.metric("Total Categories", stats['total_categories'])
                     with col2:
-                        st.metric("Total Criteria", total_criteria)
+                        st.metric("Total Criteria", stats['total_criteria'])
                     with col3:
-                        st.metric("Total Points", total_points)
+                        st.metric("Total Points", stats['total_points'])
 
                     st.markdown("#### 📂 Categories & Criteria")
                     for cat in rubric_data['categories']:
@@ -139,157 +474,15 @@ else:
                 # st.markdown("---")
                 st.subheader("📄 Rubric as Code")
 
-                # Show full JSON
-                with st.expander("📄 View Full JSON"):
+                # Show full JSON (only sent to the browser on request)
+                if st.checkbox("📄 View Full JSON", key="show_rubric_json"):
                     st.json(rubric_data)
             
             with tab2:
                 # Edit Mode - Redesigned for better UX
                 # st.subheader("✏️ Edit Rubric")
 
-                # Initialize session state for undo functionality
-                if 'rubric_backup' not in st.session_state:
-                    st.session_state['rubric_backup'] = None
-                if 'last_action' not in st.session_state:
-                    st.session_state['last_action'] = None
-
-                # Main editing form with tabs (Recommendations #2, #3, #4)
-                with st.form(f"edit_rubric_form_{rubric_name}"):
-                    # Form tabs for progressive disclosure
-                    form_tab1, form_tab2, form_tab3 = st.tabs(["📝 Basic Info", "🎯 Scoring Thresholds", "📂 Categories & Criteria"])
-
-                    with form_tab1:
-                        col1, col2 = st.columns(2)
-                        with col1:
-                            name = st.text_input("Rubric Name", value=rubric_data.get('name', ''),
-                                               help="Display name for the rubric")
-                            version = st.text_input("Version", value=rubric_data.get('version', '1.0'),
-                                                  help="Current version (auto-incremented when saved)", disabled=True)
-                        with col2:
-                            rubric_id = st.text_input("Rubric ID", value=rubric_data.get('rubric_id', ''),
-                                                    help="Unique identifier (read-only)", disabled=True)
-                            # Calculate max score from criteria
-                            calculated_max_score = sum(crit.get('max_points', 0) for cat in rubric_data.get('categories', []) for crit in cat.get('criteria', []))
-                            st.number_input("Maximum Score (Calculated)", min_value=0, value=calculated_max_score,
-                                          disabled=True, help="Automatically calculated from all criteria points", key="edit_max_score_display")
-
-                        description = st.text_area("Description", value=rubric_data.get('description', ''),
-                                                 help="Brief description of what this rubric evaluates", height=100)
-
-                    with form_tab2:
-                        st.info("Set the percentage thresholds for pass/fail decisions.")
-
-                        current_max_score = rubric_data.get('scale', {}).get('max', 50)
-                        col1, col2 = st.columns(2)
-                        with col1:
-                            current_pass_abs = rubric_data.get('thresholds', {}).get('pass', 35)
-                            current_pass_pct = (current_pass_abs / current_max_score * 100) if current_max_score > 0 else 70
-                            pass_threshold_pct = st.number_input("Pass Threshold (%)", min_value=0, max_value=100, step=1,
-                                                               value=int(current_pass_pct),
-                                                               help="Percentage score required to pass")
-                        with col2:
-                            current_revise_abs = rubric_data.get('thresholds', {}).get('revise', 25)
-                            current_revise_pct = (current_revise_abs / current_max_score * 100) if current_max_score > 0 else 50
-                            revise_threshold_pct = st.number_input("Resubmit Threshold (%)", min_value=0, max_value=100, step=1,
-                                                                 value=int(current_revise_pct),
-                                                                 help="Minimum score to allow video resubmission")
-
-                    with form_tab3:
-                        if is_new_format:
-                            st.info("Edit the content and details of existing categories and criteria.")
-
-                            categories = rubric_data.get('categories', [])
-                            if categories:
-                                col1, col2, col3 = st.columns(3)
-                                with col1:
-                                    st.metric("Total Categories", total_categories)
-                                    st.caption(f"Total weight: {total_weight:.3f} (should be 1.0)")
-                                with col2:
-                                    st.metric("Total Criteria", total_criteria)
-                                with col3:
-                                    st.metric("Total Points", total_points)
-
-                                for i, cat in enumerate(categories):
-                                    with st.expander(f"📁 {cat.get('label', f'Category {i+1}')} (Weight: {cat.get('weight', 0):.3f})", expanded=False):
-                                        col1, col2, col3 = st.columns([2, 1, 1])
-                                        with col1:
-                                            cat['label'] = st.text_input("Category Label", value=cat.get('label', ''),
-                                                                       key=f"edit_cat_label_{i}")
-                                            cat['category_id'] = st.text_input(f"Category ID", value=cat.get('category_id', ''),
-                                                                             key=f"edit_cat_id_{i}")
-                                        with col2:
-                                            cat['weight'] = st.number_input(f"Weight", min_value=0.0, max_value=1.0, step=0.01,
-                                                                          value=cat.get('weight', 0.0), key=f"edit_cat_weight_{i}")
-                                        with col3:
-                                            cat['max_points'] = st.number_input(f"Max Points", min_value=1,
-                                                                              value=cat.get('max_points', 10), key=f"edit_cat_points_{i}")
-
-                                        # Criteria editing
-                                        criteria = cat.get('criteria', [])
-                                        st.markdown(f"**Criteria for {cat.get('label', f'Category {i+1}')}**")
-
-                                        for j, criterion in enumerate(criteria):
-                                            st.markdown(f"**Criterion {j+1:02d}:**")
-                                            col1, col2 = st.columns([2, 1])
-                                            with col1:
-                                                criterion['label'] = st.text_input(f"Label", value=criterion.get('label', ''),
-                                                                                 key=f"edit_crit_label_{i}_{j}")
-                                                criterion['criterion_id'] = st.text_input(f"ID", value=criterion.get('criterion_id', ''),
-                                                                                        key=f"edit_crit_id_{i}_{j}")
-                                            with col2:
-                                                criterion['max_points'] = st.number_input(f"Points", min_value=1,
-                                                                                        value=criterion.get('max_points', 5),
-                                                                                        key=f"edit_crit_points_{i}_{j}")
-
-                                            criterion['desc'] = st.text_area(f"Description", value=criterion.get('desc', ''),
-                                                                           key=f"edit_crit_desc_{i}_{j}", height=80)
-                                            st.divider()
-                            else:
-                                st.info("No categories found. Add Categories and Criteria with the button below.")
-                        else:
-                            st.warning("⚠️ Legacy format rubric - only basic info and thresholds can be edited. Convert to new format for full editing capabilities.")
-
-                    # Submit button (Recommendation #5 - unified action)
-                    submitted = st.form_submit_button("💾 Save All Changes", use_container_width=True, type="primary")
-
-                    if submitted:
-                        # Update the rubric data
-                        rubric_data['name'] = str(name).strip()
-                        rubric_data['description'] = str(description).strip()
-                        rubric_data['rubric_id'] = str(rubric_id).strip()
-                        rubric_data['version'] = str(version).strip()
-
-                        # Calculate max score from criteria
-                        calculated_max_score = sum(crit.get('max_points', 0) for cat in rubric_data.get('categories', []) for crit in cat.get('criteria', []))
-                        rubric_data['scale']['max'] = calculated_max_score
-
-                        # Convert percentage thresholds to absolute values
-                        pass_threshold = int((pass_threshold_pct / 100.0) * calculated_max_score)
-                        revise_threshold = int((revise_threshold_pct / 100.0) * calculated_max_score)
-                        rubric_data['thresholds']['pass'] = pass_threshold
-                        rubric_data['thresholds']['revise'] = revise_threshold
-
-                        # Validate the updated rubric
-                        is_valid = validate_and_display(rubric_data, name, mode="inline")
-                        if is_valid:
-                            # Auto-increment version for new-format rubrics
-                            if is_new_format:
-                                current_version = rubric_data.get('version', '1.0')
-                                new_version = increment_version(current_version)
-                                rubric_data['version'] = new_version
-                                st.info(f"📈 Version incremented: {current_version} → {new_version}")
-
-                            # Save the rubric
-                            success, error = save_rubric_to_file(rubric_data, rubric_name)
-                            if success:
-                                st.success(f"✅ Rubric '{name}' updated successfully!")
-                                st.balloons()
-                                # Clear undo state after successful save
-                                st.session_state['rubric_backup'] = None
-                                st.session_state['last_action'] = None
-                                st.rerun()
-                            else:
-                                st.error(f"❌ Error saving rubric: {error}")
+                edit_rubric_form(rubric_name, rubric_data, is_new_format, stats, (pass_pct, revise_pct))
 
                 # Consolidated Structure Management (Recommendation #1) - Moved below form for better workflow
                 if is_new_format:
@@ -297,58 +490,25 @@ else:
                         st.markdown("**Add/Remove Categories and Criteria**")
                         st.info("Changes here are applied immediately. Use 'Undo Last Change' if needed.")
 
+                        for message in structure_messages:
+                            st.success(message)
+
+                        # Buttons queue their edit via on_click; it is applied
+                        # on the rerun Streamlit does after the click
                         col1, col2, col3 = st.columns([1, 1, 1])
                         with col1:
-                            if st.button("➕ Add Category", use_container_width=True, help="Add a new evaluation category"):
-                                # Create backup for undo
-                                st.session_state['rubric_backup'] = json.loads(json.dumps(rubric_data))
-                                st.session_state['last_action'] = 'add_category'
-
-                                categories = rubric_data.get('categories', [])
-                                # Use varied placeholder names to encourage customization
-                                category_placeholders = ["New Category", "Custom Category", "Evaluation Area", "Assessment Category"]
-                                placeholder = category_placeholders[len(categories) % len(category_placeholders)]
-                                categories.append({
-                                    'category_id': f'category_{len(categories)+1}',
-                                    'label': placeholder,
-                                    'weight': 0.0,
-                                    'max_points': 10,
-                                    'criteria': [{
-                                        'criterion_id': 'criterion_1',
-                                        'label': 'New Criterion',
-                                        'desc': '',
-                                        'max_points': 5
-                                    }]
-                                })
-                                rubric_data['categories'] = categories
-                                st.success("✅ Category added!")
-                                st.rerun()
+                            st.button("➕ Add Category", use_container_width=True, help="Add a new evaluation category",
+                                      on_click=queue_structure_op, args=(rubric_name, 'add_category'))
 
                         with col2:
-                            if st.button("🔄 Reset Labels", use_container_width=True, help="Reset criterion labels to varied placeholder names that encourage customization"):
-                                st.session_state['rubric_backup'] = json.loads(json.dumps(rubric_data))
-                                st.session_state['last_action'] = 'reset_labels'
-
-                                categories = rubric_data.get('categories', [])
-                                renumber_criteria(categories)
-                                rubric_data['categories'] = categories
-                                st.success("✅ Labels reset successfully!")
-                                st.rerun()
+                            st.button("🔄 Reset Labels", use_container_width=True, help="Reset criterion labels to varied placeholder names that encourage customization",
+                                      on_click=queue_structure_op, args=(rubric_name, 'reset_labels'))
 
                         with col3:
-                            if st.button("↶ Undo Last Change", use_container_width=True,
-                                       disabled=st.session_state['rubric_backup'] is None,
-                                       help="Undo the last structural change"):
-                                if st.session_state['rubric_backup'] is not None:
-                                    rubric_data.clear()
-                                    rubric_data.update(st.session_state['rubric_backup'])
-                                    action = st.session_state['last_action']
-                                    st.success(f"✅ Undid: {action.replace('_', ' ').title()}")
-                                    st.session_state['rubric_backup'] = None
-                                    st.session_state['last_action'] = None
-                                    st.rerun()
-                                else:
-                                    st.warning("No action to undo")
+                            st.button("↶ Undo Last Change", use_container_width=True,
+                                      disabled=f"undo:{rubric_name}" not in st.session_state,
+                                      help="Undo the last structural change",
+                                      on_click=queue_structure_op, args=(rubric_name, 'undo'))
 
                         # Category-specific management
                         categories = rubric_data.get('categories', [])
@@ -361,36 +521,15 @@ else:
                                     col1, col2, col3 = st.columns([1, 1, 1])
 
                                     with col1:
-                                        if st.button(f"➕ Add Criterion", key=f"add_crit_{i}",
-                                                   help=f"Add criterion to {cat.get('label', f'Category {i+1}')}"):
-                                            st.session_state['rubric_backup'] = json.loads(json.dumps(rubric_data))
-                                            st.session_state['last_action'] = f'add_criterion_to_{cat.get("label", f"category_{i+1}")}'
-
-                                            criteria = cat.get('criteria', [])
-                                            # Use varied placeholder names to encourage customization
-                                            criterion_placeholders = ["New Criterion", "Custom Criterion", "Assessment Item", "Evaluation Point", "Quality Measure"]
-                                            placeholder = criterion_placeholders[len(criteria) % len(criterion_placeholders)]
-                                            criteria.append({
-                                                'criterion_id': f'criterion_{len(criteria)+1}',
-                                                'label': placeholder,
-                                                'desc': '',
-                                                'max_points': 5
-                                            })
-                                            rubric_data['categories'] = categories
-                                            st.success("✅ Criterion added!")
-                                            st.rerun()
+                                        st.button(f"➕ Add Criterion", key=f"add_crit_{i}",
+                                                  help=f"Add criterion to {cat.get('label', f'Category {i+1}')}",
+                                                  on_click=queue_structure_op, args=(rubric_name, 'add_criterion', i))
 
                                     with col2:
                                         if len(cat.get('criteria', [])) > 1:
-                                            if st.button(f"🗑️ Remove Category", key=f"remove_cat_{i}",
-                                                       help=f"Remove {cat.get('label', f'Category {i+1}')} and all its criteria"):
-                                                st.session_state['rubric_backup'] = json.loads(json.dumps(rubric_data))
-                                                st.session_state['last_action'] = f'remove_category_{cat.get("label", f"category_{i+1}")}'
-
-                                                categories.pop(i)
-                                                rubric_data['categories'] = categories
-                                                st.success("✅ Category removed!")
-                                                st.rerun()
+                                            st.button(f"🗑️ Remove Category", key=f"remove_cat_{i}",
+                                                      help=f"Remove {cat.get('label', f'Category {i+1}')} and all its criteria",
+                                                      on_click=queue_structure_op, args=(rubric_name, 'remove_category', i))
 
                                     with col3:
                                         criteria = cat.get('criteria', [])
@@ -401,17 +540,10 @@ else:
                                             for j, criterion in enumerate(criteria):
                                                 col_idx = j % 3
                                                 with crit_cols[col_idx]:
-                                                    if st.button(f"🗑️ {criterion.get('label', f'C{j+1}')}",
-                                                               key=f"remove_crit_{i}_{j}",
-                                                               help=f"Remove {criterion.get('label', f'Criterion {j+1}')}"):
-                                                        st.session_state['rubric_backup'] = json.loads(json.dumps(rubric_data))
-                                                        st.session_state['last_action'] = f'remove_criterion_{criterion.get("label", f"criterion_{j+1}")}'
-
-                                                        criteria.pop(j)
-                                                        rubric_data['categories'] = categories
-                                                        renumber_criteria(categories)
-                                                        st.success("✅ Criterion removed!")
-                                                        st.rerun()
+                                                    st.button(f"🗑️ {criterion.get('label', f'C{j+1}')}",
+                                                              key=f"remove_crit_{i}_{j}",
+                                                              help=f"Remove {criterion.get('label', f'Criterion {j+1}')}",
+                                                              on_click=queue_structure_op, args=(rubric_name, 'remove_criterion', i, j))
 
             # Rubric Actions - Grouped together above delete warning
             st.markdown("### 🛠️ Rubric Actions")
@@ -419,8 +551,8 @@ else:
             with col1:
                 if st.button("💾 Create Backup", use_container_width=True, help="Create a timestamped backup of this rubric without changing its version"):
                     with st.spinner("Creating backup..."):
-                        # Create backup by saving the current rubric (this will create a timestamped backup automatically)
-                        success, error = save_rubric_to_file(rubric_data, rubric_name, create_backup=True)
+                        # Back up the saved file as-is; unsaved edits in the working copy stay pending
+                        success, error = backup_rubric_file(rubric_name)
                         if success:
                             st.session_state['backup_result'] = {'success': True, 'message': "✅ Backup created successfully!", 'info': "The backup has been saved to the versions directory with a timestamp."}
                         else:
@@ -463,6 +595,7 @@ else:
                     try:
                         if file_path.exists():
                             file_path.unlink()
+                            discard_working_rubric(rubric_name)
                             st.success(f"✅ Rubric '{rubric_name}' has been deleted. Archived versions are preserved.")
                         else:
                             st.error(f"❌ File {file_path} not found.")
@@ -1,38 +1,51 @@
 import sys
 import os
+import re
 import secrets
-import string
 # Add project root to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 import streamlit as st
-from pathlib import Path
-import json
-from rubric_helper import (
-    list_available_rubrics, load_rubric_from_file, validate_rubric,
-    list_rubric_versions, restore_rubric_version, show_rubric_details,
-    save_rubric_to_file, increment_version, get_rubrics_dir
-)
+from rubric_helper import save_rubric_to_file
 from validation_ui import validate_and_display
-
-def generate_random_id(length=4):
-    """Generate a random alphanumeric string of specified length."""
-    alphabet = string.ascii_letters + string.digits
-    return ''.join(secrets.choice(alphabet) for _ in range(length))
-
-def generate_rubric_id(name):
-    """Generate the rubric ID from the name."""
+from rubric_cache import rubrics_signature, cached_rubric_list, load_rubric
+
+def scan_rubrics(available_rubrics):
+    """Collect the names and IDs already taken by available rubrics, in one pass.
+
+    Names come from the rubric listing, so no rubric file is opened here.
+
+    Returns:
+        Tuple of (existing_names, existing_ids)
+    """
+    existing_names = set()
+    existing_ids = set()
+    for r in available_rubrics:
+        existing_ids.add(r['filename'].removesuffix('.json').removesuffix('-rubric'))
+        if r.get('name'):
+            existing_names.add(r['name'].strip())
+    return existing_names, existing_ids
+
+def generate_random_ids(count, length=4):
+    """Generate count random hex strings of the given length from one token."""
+    token = secrets.token_hex((count * length + 1) // 2)
+    return [token[i:i + length] for i in range(0, count * length, length)]
+
+# Spaces and underscores become dashes; anything else that isn't alphanumeric is dropped
+SLUG_SEPARATORS = str.maketrans(' _', '--')
+SLUG_DISALLOWED = re.compile(r'[^\w-]')
+# Runs of dashes left behind by replaced spaces/underscores and removed characters
+DASH_RUN = re.compile(r'-+')
+
+def generate_rubric_id(name, existing_ids):
+    """Generate the rubric ID from the name, avoiding IDs in existing_ids (a set)."""
     if not name:
         return ''
-    base_id = name.lower().replace(' ', '-').replace('_', '-')
-    base_id = ''.join(c for c in base_id if c.isalnum() or c == '-')
-    while '--' in base_id:
-        base_id = base_id.replace('--', '-')
-    base_id = base_id.strip('-')
+    base_id = SLUG_DISALLOWED.sub('', name.lower().translate(SLUG_SEPARATORS))
+    base_id = DASH_RUN.sub('-', base_id).strip('-')
 
     # Ensure uniqueness
     rubric_id = base_id
-    existing_ids = [r['filename'].replace('-rubric', '').replace('.json', '') for r in list_available_rubrics()]
     counter = 1
     while rubric_id in existing_ids:
         rubric_id = f"{base_id}-{counter}"
@@ -40,6 +53,53 @@ def generate_rubric_id(name):
 
     return rubric_id
 
+def default_categories(rubric_id, random_ids):
+    """Build the starter categories for a new rubric.
+
+    Args:
+        rubric_id: ID of the rubric being created
+        random_ids: One (category, criterion 1, criterion 2) suffix triple per category
+
+    Returns:
+        Tuple of (categories, max_score); each category has two 5-point criteria
+    """
+    categories = []
+    max_score = 0
+    cat_prefix = rubric_id + '_cat-'
+    for i, (cat_random, *crit_randoms) in enumerate(random_ids, 1):
+        category_id = cat_prefix + cat_random
+        crit_prefix = rubric_id + '_' + category_id + '_crit-'
+        categories.append({
+            'category_id': category_id,
+            'label': f'Category {i:02d}',
+            'weight': 1.0 / len(random_ids),
+            'max_points': 5 * len(crit_randoms),
+            'criteria': [{
+                'criterion_id': crit_prefix + crit_random,
+                'label': f'Criterion {j:02d}',
+                'desc': '',
+                'max_points': 5
+            } for j, crit_random in enumerate(crit_randoms, 1)]
+        })
+        max_score += 5 * len(crit_randoms)
+    return categories, max_score
+
+def check_unique_ids(categories):
+    """Return an error message for the first duplicate category or criterion ID, else None."""
+    seen_cat_ids = set()
+    seen_crit_ids = set()
+    for cat in categories:
+        cat_id = cat.get('category_id', '')
+        if cat_id in seen_cat_ids:
+            return "Category IDs must be unique"
+        seen_cat_ids.add(cat_id)
+        for crit in cat.get('criteria', []):
+            crit_id = crit.get('criterion_id', '')
+            if crit_id in seen_crit_ids:
+                return "Criterion IDs must be unique across all categories"
+            seen_crit_ids.add(crit_id)
+    return None
+
 st.set_page_config(
     page_title="➕ Create Rubric - AI Video Analyzer",
     page_icon="➕",
@@ -49,14 +109,6 @@ st.set_page_config(
 st.title("➕ Create New Rubric")
 st.markdown("Create a new evaluation rubric with categories and criteria.")
 
-# Get available rubrics for uniqueness check
-available_rubrics = list_available_rubrics()
-existing_rubric_names = set()
-for r in available_rubrics:
-    data, _ = load_rubric_from_file(r['filename'])
-    if data and 'name' in data:
-        existing_rubric_names.add(data['name'].strip())
-
 # Initialize session state for rubric creation
 if 'create_rubric_data' not in st.session_state:
     st.session_state.create_rubric_data = {
@@ -90,59 +142,11 @@ with st.form("create_rubric_form"):
     submitted = st.form_submit_button("🚀 Create Rubric", use_container_width=True, type="primary")
 
     if submitted:
+        # Names and IDs already taken, for the uniqueness checks
+        existing_rubric_names, existing_ids = scan_rubrics(cached_rubric_list(rubrics_signature()))
+
         # Generate rubric ID
-        rubric_id = generate_rubric_id(name.strip())
-
-        # Auto-add default categories
-        categories = []
-        # Category 1
-        cat1_random = generate_random_id()
-        category1_id = f"{rubric_id}_cat-{cat1_random}"
-        crit1_random = generate_random_id()
-        criterion1_id = f"{rubric_id}_{category1_id}_crit-{crit1_random}"
-        crit2_random = generate_random_id()
-        criterion2_id = f"{rubric_id}_{category1_id}_crit-{crit2_random}"
-        categories.append({
-            'category_id': category1_id,
-            'label': 'Category 01',
-            'weight': 0.5,
-            'max_points': 10,
-            'criteria': [{
-                'criterion_id': criterion1_id,
-                'label': 'Criterion 01',
-                'desc': '',
-                'max_points': 5
-            }, {
-                'criterion_id': criterion2_id,
-                'label': 'Criterion 02',
-                'desc': '',
-                'max_points': 5
-            }]
-        })
-        # Category 2
-        cat2_random = generate_random_id()
-        category2_id = f"{rubric_id}_cat-{cat2_random}"
-        crit3_random = generate_random_id()
-        criterion3_id = f"{rubric_id}_{category2_id}_crit-{crit3_random}"
-        crit4_random = generate_random_id()
-        criterion4_id = f"{rubric_id}_{category2_id}_crit-{crit4_random}"
-        categories.append({
-            'category_id': category2_id,
-            'label': 'Category 02',
-            'weight': 0.5,
-            'max_points': 10,
-            'criteria': [{
-                'criterion_id': criterion3_id,
-                'label': 'Criterion 01',
-                'desc': '',
-                'max_points': 5
-            }, {
-                'criterion_id': criterion4_id,
-                'label': 'Criterion 02',
-                'desc': '',
-                'max_points': 5
-            }]
-        })
+        rubric_id = generate_rubric_id(name.strip(), existing_ids)
 
         # Validate form data
         errors = []
@@ -157,30 +161,21 @@ with st.form("create_rubric_form"):
         if not rubric_id:
             errors.append("Rubric ID could not be generated")
 
-        # Validate categories
-        total_weight = sum(cat.get('weight', 0) for cat in categories)
-        if not (0.99 <= total_weight <= 1.01):
-            errors.append(f"Category weights must sum to 1.0 (current: {total_weight:.3f})")
-
-        # Check category and criterion IDs are unique
-        all_cat_ids = [cat.get('category_id', '') for cat in categories]
-        if len(all_cat_ids) != len(set(all_cat_ids)):
-            errors.append("Category IDs must be unique")
+        # Only build the default categories once the basic checks pass
+        if not errors:
+            # Auto-add default categories
+            random_ids = generate_random_ids(6)
+            categories, calculated_max_score = default_categories(rubric_id, [random_ids[0:3], random_ids[3:6]])
 
-        all_crit_ids = []
-        for cat in categories:
-            for crit in cat.get('criteria', []):
-                all_crit_ids.append(crit.get('criterion_id', ''))
-        if len(all_crit_ids) != len(set(all_crit_ids)):
-            errors.append("Criterion IDs must be unique across all categories")
+            # Check category and criterion IDs are unique
+            id_error = check_unique_ids(categories)
+            if id_error:
+                errors.append(id_error)
 
         if errors:
             for error in errors:
                 st.error(f"❌ {error}")
         else:
-            # Calculate maximum score from criteria
-            calculated_max_score = sum(crit.get('max_points', 0) for cat in categories for crit in cat.get('criteria', []))
-
             # Convert percentage thresholds to absolute values
             pass_threshold = int((pass_threshold_pct / 100.0) * calculated_max_score)
             revise_threshold = int((revise_threshold_pct / 100.0) * calculated_max_score)
@@ -221,7 +216,7 @@ with st.form("create_rubric_form"):
 if 'auto_select_rubric' in st.session_state:
     rubric_name = st.session_state['auto_select_rubric']
     # Try to get the rubric data to show the name
-    rubric_data, error = load_rubric_from_file(rubric_name)
+    rubric_data, error = load_rubric(rubric_name)
     if rubric_data:
         display_name = rubric_data.get('name', rubric_name)
         st.success(f"✅ Rubric '{display_name}' created successfully!")
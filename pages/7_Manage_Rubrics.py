@@ -4,9 +4,34 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 import streamlit as st
-from rubric_helper import (
-    list_available_rubrics, list_rubric_versions, restore_rubric_version, get_rubrics_dir
-)
+from rubric_helper import list_rubric_versions, restore_rubric_version, get_rubrics_dir
+from rubric_cache import rubrics_signature, cached_rubric_list
+
+@st.cache_data(show_spinner=False)
+def cached_versions_count(mtime_ns):
+    """Number of archived rubric versions; recounted only when the versions directory changes."""
+    versions_dir = get_rubrics_dir() / "versions"
+    return sum(1 for _ in versions_dir.glob("*.json")) if versions_dir.exists() else 0
+
+def versions_dir_mtime():
+    """mtime of the versions directory (0 if it does not exist)."""
+    try:
+        return (get_rubrics_dir() / "versions").stat().st_mtime_ns
+    except OSError:
+        return 0
+
+@st.cache_data(show_spinner=False)
+def cached_rubric_versions(filename, signature):
+    """List a rubric's versions; re-read only when the rubric or its backups change."""
+    return list_rubric_versions(filename)
+
+def rubric_versions_signature(filename):
+    """Cheap fingerprint of a rubric's current file and the versions directory."""
+    try:
+        current_mtime = (get_rubrics_dir() / f"{filename}.json").stat().st_mtime_ns
+    except OSError:
+        current_mtime = 0
+    return current_mtime, versions_dir_mtime()
 
 st.set_page_config(
     page_title="📊 Rubric Dashboard - AI Video Analyzer",
@@ -18,7 +43,7 @@ st.title("📊 Rubric Dashboard")
 st.markdown("View rubric overview, manage versions, and restore previous states.")
 
 # Load available rubrics
-available_rubrics = list_available_rubrics()
+available_rubrics = cached_rubric_list(rubrics_signature())
 
 # Overview metrics
 col1, col2, col3 = st.columns(3)
@@ -31,9 +56,8 @@ with col2:
     st.metric("Sample Rubrics", len(sample_rubrics))
     
 with col3:
-    # Check if archived version rubrics directory exists and count files
-    versions_dir = get_rubrics_dir() / "versions"
-    versions_count = len(list(versions_dir.glob("*.json"))) if versions_dir.exists() else 0
+    # Count archived version rubrics (cached until the versions directory changes)
+    versions_count = cached_versions_count(versions_dir_mtime())
     st.metric("Archived Rubric Versions", versions_count)
 
 st.markdown("---")
@@ -48,59 +72,68 @@ else:
     default_index = 0
     if 'auto_select_rubric' in st.session_state:
         # Auto-select the specified rubric
-        rubric_name = st.session_state['auto_select_rubric']
-        available_filenames = [r['filename'] for r in available_rubrics]
-        if rubric_name in available_filenames:
-            default_index = available_filenames.index(rubric_name) + 1  # +1 because of empty option
+        filename_to_index = {r['filename']: i for i, r in enumerate(available_rubrics)}
+        index = filename_to_index.get(st.session_state['auto_select_rubric'])
+        if index is not None:
+            default_index = index + 1  # +1 because of empty option
         else:
             # Clear invalid auto-select state
             del st.session_state['auto_select_rubric']
     
-    version_rubric_name = st.selectbox(
-        "Select rubric",
-        options=version_options,
-        index=default_index,
-        key="version_rubric_select"
-    )
+    # Changing the selection only reruns the page once "Load Versions" is pressed
+    with st.form("manage_select"):
+        selected_rubric = st.selectbox(
+            "Select rubric",
+            options=version_options,
+            index=default_index,
+            key="version_rubric_select"
+        )
+        load_versions = st.form_submit_button("📂 Load Versions")
+    if load_versions or default_index:
+        st.session_state['loaded_rubric'] = selected_rubric
+    version_rubric_name = st.session_state.get('loaded_rubric', '')
+    if version_rubric_name not in version_options:
+        version_rubric_name = ''
 
     if version_rubric_name:
-        versions = list_rubric_versions(version_rubric_name)
+        versions = cached_rubric_versions(version_rubric_name, rubric_versions_signature(version_rubric_name))
 
         if not versions:
             st.info(f"No versions found for rubric '{version_rubric_name}'.")
         else:
             st.markdown(f"**Available Versions for '{version_rubric_name}':**")
 
-            # Create a table-like display
-            for version in versions:
-                with st.container():
-                    col1, col2, col3, col4 = st.columns([2, 2, 3, 1])
-
-                    with col1:
-                        version_type = "📄 Current" if version['type'] == 'current' else "💾 Backup"
-                        st.markdown(f"**{version_type}**")
-
-                    with col2:
-                        st.markdown(f"**v{version['version']}**")
-
-                    with col3:
-                        timestamp = version.get('timestamp', 'Current')
-                        st.markdown(f"*{timestamp}*")
-
-                    with col4:
-                        if version['type'] == 'backup':
-                            if st.button("🔄", key=f"restore_{version['version']}_{version_rubric_name}_{version.get('timestamp', 'current')}", help="Restore this version"):
-                                with st.spinner("Restoring version..."):
-                                    success, error = restore_rubric_version(version_rubric_name, version['version'])
-                                    if success:
-                                        st.success(f"✅ Restored '{version_rubric_name}' to version {version['version']}")
-                                        st.rerun()
-                                    else:
-                                        st.error(f"❌ Error: {error}")
-                        else:
-                            st.markdown("*Current*")
-
-                    st.divider()
+            # One table for all versions, plus a single restore control
+            st.dataframe(
+                [{
+                    'Type': "📄 Current" if version['type'] == 'current' else "💾 Backup",
+                    'Version': f"v{version['version']}",
+                    'Timestamp': version.get('timestamp', 'Current'),
+                } for version in versions],
+                hide_index=True,
+                use_container_width=True
+            )
+
+            backups = [version for version in versions if version['type'] == 'backup']
+            if backups:
+                col1, col2 = st.columns([3, 1], vertical_alignment="bottom")
+                with col1:
+                    restore_version = st.selectbox(
+                        "Restore version",
+                        options=backups,
+                        format_func=lambda version: f"v{version['version']} ({version['timestamp']})",
+                        key=f"restore_select_{version_rubric_name}"
+                    )
+                with col2:
+                    if st.button("🔄 Restore", use_container_width=True, help="Restore the selected version"):
+                        with st.spinner("Restoring version..."):
+                            success, error = restore_rubric_version(version_rubric_name, restore_version['version'])
+                            if success:
+                                cached_rubric_versions.clear()
+                                st.success(f"✅ Restored '{version_rubric_name}' to version {restore_version['version']}")
+                                st.rerun()
+                            else:
+                                st.error(f"❌ Error: {error}")
 
 # Navigation
 st.markdown("---")
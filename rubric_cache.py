@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Rubric Cache
+
+Streamlit-cached access to the rubric files, shared by the rubric pages.
+Cache entries are keyed on file modification times, so edits made on disk
+(or by another page) are picked up on the next rerun.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+import streamlit as st
+
+from rubric_helper import get_rubrics_dir, list_available_rubrics, load_rubric_from_file
+
+
+def rubrics_signature() -> Tuple[Tuple[str, int], ...]:
+    """Cheap fingerprint of the rubrics directory (file paths and mtimes)."""
+    signature = []
+    for rubric_file in get_rubrics_dir().glob("*.json"):
+        try:
+            signature.append((str(rubric_file), rubric_file.stat().st_mtime_ns))
+        except OSError:
+            continue
+    return tuple(sorted(signature))
+
+
+@st.cache_data(show_spinner=False)
+def cached_rubric_list(signature: Tuple[Tuple[str, int], ...]) -> List[Dict[str, str]]:
+    """List available rubrics; re-scanned only when the rubrics directory changes."""
+    return list_available_rubrics()
+
+
+@st.cache_data(show_spinner=False)
+def cached_load_rubric(filename: str, mtime_ns: int) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """Load and parse a rubric file; cached per (filename, mtime)."""
+    return load_rubric_from_file(filename)
+
+
+def load_rubric(filename: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """
+    Load a rubric, re-parsing only if the file changed.
+
+    Returns:
+        Tuple of (rubric, error_message), as load_rubric_from_file
+    """
+    try:
+        mtime_ns = (get_rubrics_dir() / f"{filename}.json").stat().st_mtime_ns
+    except OSError:
+        return load_rubric_from_file(filename)
+    return cached_load_rubric(filename, mtime_ns)
@@ -48,6 +48,33 @@ import sys
 from pathlib import Path
 from typing import Dict, Any, Tuple, List, Optional
 
+# orjson parses rubric files noticeably faster; optional, stdlib json otherwise
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _parse_json(data: bytes) -> Any:
+    """Parse JSON from raw file bytes, with orjson when it's installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dump_json(obj: Any) -> bytes:
+    """Serialize to indented JSON bytes, with orjson when it's installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+
+def _write_json(path: Path, obj: Any) -> None:
+    """Write obj as indented JSON in a single buffered binary write."""
+    data = _dump_json(obj)
+    with open(path, 'wb', buffering=64 * 1024) as f:
+        f.write(data)
+
 
 def validate_rubric(rubric: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
     """
@@ -222,8 +249,7 @@ def load_rubric_from_file(filename: str) -> Tuple[Optional[Dict[str, Any]], Opti
         return None, f"Rubric file not found: {rubric_path}"
 
     try:
-        with open(rubric_path, 'r') as f:
-            rubric = json.load(f)
+        rubric = _parse_json(rubric_path.read_bytes())
         return rubric, None
     except json.JSONDecodeError as e:
         return None, f"Invalid JSON in {rubric_path}: {e}"
@@ -231,6 +257,51 @@ def load_rubric_from_file(filename: str) -> Tuple[Optional[Dict[str, Any]], Opti
         return None, f"Error loading {rubric_path}: {e}"
 
 
+def backup_rubric_file(filename: str) -> Tuple[bool, Optional[str]]:
+    """Copy the on-disk rubric into versions/ as an archived backup, return (success, error_message)."""
+    rubrics_dir = get_rubrics_dir()
+    rubric_path = rubrics_dir / f"{filename}.json"
+    if not rubric_path.exists():
+        return False, f"Rubric file not found: {rubric_path}"
+
+    try:
+        # Create versions directory if it doesn't exist
+        versions_dir = rubrics_dir / "versions"
+        versions_dir.mkdir(exist_ok=True)
+
+        # Get current timestamp
+        from datetime import datetime
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+        # Load current rubric to get version info
+        try:
+            with open(rubric_path, 'r') as f:
+                current_rubric = json.load(f)
+            current_version = current_rubric.get('version', '1.0')
+        except:
+            current_version = 'unknown'
+
+        # Create backup filename
+        backup_filename = f"{filename}.v{current_version}.{timestamp}.json"
+        backup_path = versions_dir / backup_filename
+
+        # Copy current file to backup
+        import shutil
+        shutil.copy2(rubric_path, backup_path)
+    except Exception as e:
+        return False, f"Could not create backup: {e}"
+
+    # Mark the backup as archived
+    try:
+        backup_rubric = _parse_json(backup_path.read_bytes())
+        backup_rubric['status'] = 'archive'
+        _write_json(backup_path, backup_rubric)
+        print(f"💾 Backup created: {backup_filename} (status: archive)")
+    except Exception as e:
+        print(f"⚠️  Warning: Could not mark backup as archived: {e}")
+    return True, None
+
+
 def save_rubric_to_file(rubric: Dict[str, Any], filename: str, create_backup: bool = True) -> Tuple[bool, Optional[str]]:
     """Save a rubric to file, return (success, error_message)."""
     rubrics_dir = get_rubrics_dir()
@@ -240,48 +311,12 @@ def save_rubric_to_file(rubric: Dict[str, Any], filename: str, create_backup: bo
 
     # Create backup if file exists and backup is requested
     if create_backup and rubric_path.exists():
-        try:
-            # Create versions directory if it doesn't exist
-            versions_dir = rubrics_dir / "versions"
-            versions_dir.mkdir(exist_ok=True)
-
-            # Get current timestamp
-            from datetime import datetime
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-
-            # Load current rubric to get version info
-            try:
-                with open(rubric_path, 'r') as f:
-                    current_rubric = json.load(f)
-                current_version = current_rubric.get('version', '1.0')
-            except:
-                current_version = 'unknown'
-
-            # Create backup filename
-            backup_filename = f"{filename}.v{current_version}.{timestamp}.json"
-            backup_path = versions_dir / backup_filename
-
-            # Copy current file to backup
-            import shutil
-            shutil.copy2(rubric_path, backup_path)
-            
-            # Mark the backup as archived
-            try:
-                with open(backup_path, 'r') as f:
-                    backup_rubric = json.load(f)
-                backup_rubric['status'] = 'archive'
-                with open(backup_path, 'w') as f:
-                    json.dump(backup_rubric, f, indent=2)
-                print(f"💾 Backup created: {backup_filename} (status: archive)")
-            except Exception as e:
-                print(f"⚠️  Warning: Could not mark backup as archived: {e}")
-
-        except Exception as e:
-            print(f"⚠️  Warning: Could not create backup: {e}")
+        success, error = backup_rubric_file(filename)
+        if not success:
+            print(f"⚠️  Warning: {error}")
 
     try:
-        with open(rubric_path, 'w') as f:
-            json.dump(rubric, f, indent=2)
+        _write_json(rubric_path, rubric)
         return True, None
     except Exception as e:
         return False, f"Error saving to {rubric_path}: {e}"
@@ -313,8 +348,7 @@ def list_available_rubrics() -> List[Dict[str, str]]:
     if rubrics_dir.exists():
         for rubric_file in sorted(rubrics_dir.glob("*.json")):
             try:
-                with open(rubric_file, 'r') as f:
-                    rubric_data = json.load(f)
+                rubric_data = _parse_json(rubric_file.read_bytes())
 
                 # Validate before adding to list
                 is_valid, _ = validate_rubric(rubric_data)
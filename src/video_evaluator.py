@@ -1,7 +1,11 @@
 import os
+import hashlib
 import tempfile
 import shutil
 import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from enum import Enum
 from typing import Optional, Dict, Any, List, Tuple, Callable
@@ -21,6 +25,10 @@ try:
     import cv2
 except Exception:
     cv2 = None
+try:
+    from faster_whisper import WhisperModel
+except Exception:
+    WhisperModel = None
 try:
     from tqdm import tqdm
 except Exception:
@@ -37,6 +45,31 @@ class AIProvider(Enum):
     ANTHROPIC = "anthropic"
 
 
+class _FasterWhisperTranscriber:
+    """Adapts a faster-whisper (CTranslate2) model to the openai-whisper transcribe() result shape."""
+
+    def __init__(self, model):
+        self.model = model
+
+    def transcribe(self, audio_path, task='transcribe', **kwargs):
+        segments, info = self.model.transcribe(audio_path, task=task, vad_filter=True)
+        segments = [
+            {
+                'start': seg.start,
+                'end': seg.end,
+                'text': seg.text,
+                'avg_logprob': seg.avg_logprob,
+                'compression_ratio': seg.compression_ratio,
+                'no_speech_prob': seg.no_speech_prob
+            } for seg in segments
+        ]
+        return {
+            'text': "".join(seg['text'] for seg in segments).strip(),
+            'language': info.language,
+            'segments': segments
+        }
+
+
 # Default rubric (fallback if rubric.json not found)
 DEFAULT_RUBRIC = {
     "criteria": [
@@ -53,6 +86,25 @@ DEFAULT_RUBRIC = {
 }
 
 
+# Required keys for each rubric format, built once rather than on every validation
+REQUIRED_KEYS_OLD = frozenset({"criteria", "scale", "overall_method", "thresholds"})
+REQUIRED_KEYS_NEW = frozenset({"rubric_id", "name", "version", "categories", "scale", "thresholds"})
+REQUIRED_CATEGORY_FIELDS = frozenset({"category_id", "label", "weight", "max_points", "criteria"})
+REQUIRED_CRITERION_FIELDS_NEW = frozenset({"criterion_id", "label", "max_points"})
+REQUIRED_CRITERION_FIELDS_OLD = frozenset({"id", "label", "desc", "weight"})
+
+# Transcripts are cached across runs, keyed by audio content, model and task
+TRANSCRIPT_CACHE_DIR = Path(tempfile.gettempdir()) / "video_eval_transcripts"
+# Cached transcripts unused for this long (seconds) are evicted on the next cache write
+TRANSCRIPT_CACHE_MAX_AGE = 30 * 24 * 60 * 60
+
+# Loaded speech-to-text models, shared by every VideoEvaluator in the process so a
+# model is only loaded once. Keyed by backend ("whisper" or "faster"); values are
+# (model, model_name, device, lock); the lock serializes transcriptions on the model
+_WHISPER_MODELS: Dict[str, Tuple[Any, str, str, threading.Lock]] = {}
+_WHISPER_MODELS_LOCK = threading.Lock()
+
+
 # Validate rubric structure
 def validate_rubric(rubric: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
     """
@@ -62,15 +114,16 @@ def validate_rubric(rubric: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
     Returns:
         Tuple of (True, None) if valid, or (False, error_message) if invalid
     """
-    # Check top-level keys - support both old and new formats
-    required_keys_old = {"criteria", "scale", "overall_method", "thresholds"}
-    required_keys_new = {"rubric_id", "name", "version", "categories", "scale", "thresholds"}
+    if not isinstance(rubric, dict):
+        return False, "Rubric must be a JSON object"
 
-    has_old_format = all(key in rubric for key in required_keys_old)
-    has_new_format = all(key in rubric for key in required_keys_new)
+    # Check top-level keys - support both old and new formats
+    rubric_keys = rubric.keys()
+    has_old_format = rubric_keys >= REQUIRED_KEYS_OLD
+    has_new_format = rubric_keys >= REQUIRED_KEYS_NEW
 
     if not (has_old_format or has_new_format):
-        return False, f"Rubric must have either old format keys {required_keys_old} or new format keys {required_keys_new}"
+        return False, f"Rubric must have either old format keys {set(REQUIRED_KEYS_OLD)} or new format keys {set(REQUIRED_KEYS_NEW)}"
 
     if has_new_format:
         # Validate new format
@@ -92,9 +145,8 @@ def _validate_new_rubric_format(rubric: Dict[str, Any]) -> Tuple[bool, Optional[
 
     for i, category in enumerate(rubric["categories"]):
         # Check required fields
-        required_fields = {"category_id", "label", "weight", "max_points", "criteria"}
-        if not all(field in category for field in required_fields):
-            missing = required_fields - set(category.keys())
+        if not category.keys() >= REQUIRED_CATEGORY_FIELDS:
+            missing = set(REQUIRED_CATEGORY_FIELDS - category.keys())
             return False, f"Category {i} missing required fields: {missing}"
 
         # Check for duplicate category IDs
@@ -129,9 +181,8 @@ def _validate_new_rubric_format(rubric: Dict[str, Any]) -> Tuple[bool, Optional[
 
         for j, criterion in enumerate(category["criteria"]):
             # Check required fields
-            required_fields = {"criterion_id", "label", "max_points"}
-            if not all(field in criterion for field in required_fields):
-                missing = required_fields - set(criterion.keys())
+            if not criterion.keys() >= REQUIRED_CRITERION_FIELDS_NEW:
+                missing = set(REQUIRED_CRITERION_FIELDS_NEW - criterion.keys())
                 return False, f"Category '{category['category_id']}' criterion {j} missing required fields: {missing}"
 
             # Check for duplicate criterion IDs
@@ -188,9 +239,8 @@ def _validate_new_rubric_format(rubric: Dict[str, Any]) -> Tuple[bool, Optional[
 def _validate_old_rubric_format(rubric: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
     """Validate old rubric format with flat criteria array (for backward compatibility)."""
     # Check top-level keys
-    required_keys = {"criteria", "scale", "overall_method", "thresholds"}
-    if not all(key in rubric for key in required_keys):
-        missing = required_keys - set(rubric.keys())
+    if not rubric.keys() >= REQUIRED_KEYS_OLD:
+        missing = set(REQUIRED_KEYS_OLD - rubric.keys())
         return False, f"Missing required keys: {missing}"
 
     # Validate criteria
@@ -201,9 +251,8 @@ def _validate_old_rubric_format(rubric: Dict[str, Any]) -> Tuple[bool, Optional[
     total_weight = 0.0
     for i, criterion in enumerate(rubric["criteria"]):
         # Check required fields
-        required_fields = {"id", "label", "desc", "weight"}
-        if not all(field in criterion for field in required_fields):
-            missing = required_fields - set(criterion.keys())
+        if not criterion.keys() >= REQUIRED_CRITERION_FIELDS_OLD:
+            missing = set(REQUIRED_CRITERION_FIELDS_OLD - criterion.keys())
             return False, f"Criterion {i} missing required fields: {missing}"
 
         # Check for duplicate IDs
@@ -253,6 +302,32 @@ def _validate_old_rubric_format(rubric: Dict[str, Any]) -> Tuple[bool, Optional[
     return True, None
 
 
+# Parsed rubric files with their validation result, keyed by path and reused while the mtime is unchanged
+_RUBRIC_CACHE: Dict[str, Tuple[int, Tuple[Dict[str, Any], bool, Optional[str]]]] = {}
+
+
+def _read_rubric_file(rubric_path: Path) -> Tuple[Dict[str, Any], bool, Optional[str]]:
+    """Parse and validate a rubric file, skipping both if the file hasn't changed since the last read.
+
+    Returns:
+        Tuple of (rubric, is_valid, error_message). The rubric dict is shared
+        between callers and must not be modified.
+
+    Raises:
+        OSError or json.JSONDecodeError if the file can't be read or parsed
+    """
+    mtime_ns = rubric_path.stat().st_mtime_ns
+    cached = _RUBRIC_CACHE.get(str(rubric_path))
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    with open(rubric_path, 'r') as f:
+        rubric = json.load(f)
+    result = (rubric, *validate_rubric(rubric))
+    _RUBRIC_CACHE[str(rubric_path)] = (mtime_ns, result)
+    return result
+
+
 # Load rubric from file or use default
 def load_rubric(rubric_name: str = "sample-rubric") -> Dict[str, Any]:
     """Load rubric from rubrics/{rubric_name}.json, validate it, or fall back to default.
@@ -261,7 +336,8 @@ def load_rubric(rubric_name: str = "sample-rubric") -> Dict[str, Any]:
         rubric_name: Name of the rubric file (without .json extension). Defaults to "sample-rubric".
         
     Returns:
-        Dict containing the rubric structure
+        Dict containing the rubric structure. Repeated loads of an unchanged
+        file return the same dict, so callers must not modify it.
     """
     # Try new rubrics directory first
     rubrics_dir = Path(__file__).parent.parent / "rubrics"
@@ -272,11 +348,8 @@ def load_rubric(rubric_name: str = "sample-rubric") -> Dict[str, Any]:
         rubric_path = Path(__file__).parent.parent / "rubric.json"
     
     try:
-        with open(rubric_path, 'r') as f:
-            rubric = json.load(f)
-        
-        # Validate the loaded rubric
-        is_valid, error_msg = validate_rubric(rubric)
+        # Parse and validate the rubric (cached until the file changes)
+        rubric, is_valid, error_msg = _read_rubric_file(rubric_path)
         if not is_valid:
             print(f"Warning: Invalid rubric format in {rubric_path}: {error_msg}. Using default rubric.")
             return DEFAULT_RUBRIC
@@ -308,11 +381,8 @@ def list_available_rubrics() -> List[Dict[str, str]]:
     if rubrics_dir.exists():
         for rubric_file in sorted(rubrics_dir.rglob("*.json")):
             try:
-                with open(rubric_file, 'r') as f:
-                    rubric_data = json.load(f)
-                
-                # Validate before adding to list
-                is_valid, _ = validate_rubric(rubric_data)
+                # Validate before adding to list (cached until the file changes)
+                rubric_data, is_valid, _ = _read_rubric_file(rubric_file)
                 # Only include rubrics marked as current
                 if is_valid and rubric_data.get('status') == 'current':
                     available.append({
@@ -520,6 +590,9 @@ class VideoEvaluator:
         # Separate OpenAI API key for Whisper transcription (always uses OpenAI's API)
         self.openai_api_key = openai_api_key if openai_api_key else (api_key if provider == AIProvider.OPENAI else None)
 
+        # Upper bound on scoring requests sent to the LLM provider at the same time
+        self.max_concurrent_requests = 4
+
         # Create temporary directory for processing
         self.temp_dir = tempfile.mkdtemp(prefix='video_eval_')
 
@@ -547,72 +620,26 @@ class VideoEvaluator:
         except ImportError:
             cv2 = None
 
-        # Load whisper model - medium for optimal multilingual transcription and translation
+        # Load whisper model - medium for optimal multilingual transcription and translation.
+        # Models are loaded once per process and shared by all evaluators (see _WHISPER_MODELS)
         self.whisper_model = None  # Initialize to None
         self.whisper_model_name = None
         self.device = "cpu"  # Default device
-        if whisper:
-            try:
-                # Use medium model for all tasks - it provides the best balance of accuracy and speed for multilingual content
-                # Medium model significantly outperforms base for non-English languages while remaining reasonably fast
-                model_name = "medium"  # Use medium model for optimal multilingual performance
-                # Try MPS (Apple Silicon GPU) first, but load on CPU first to avoid sparse tensor issues
-                try:
-                    self.whisper_model = whisper.load_model(model_name, device="cpu")
-                    # Test MPS stability before using it
-                    import torch
-                    if torch.backends.mps.is_available():
-                        try:
-                            # Quick stability test: create and use a small tensor
-                            test_tensor = torch.randn(1, 10, device='mps')
-                            test_result = torch.softmax(test_tensor, dim=-1)
-                            if not torch.isnan(test_result).any():
-                                # MPS seems stable, try selective placement
-                                self.whisper_model = self._move_model_to_mps_selective(self.whisper_model)
-                                self.device = "mps"
-                                if self.verbose:
-                                    print(f"✓ Whisper {model_name} model loaded on MPS (Apple Silicon GPU)")
-                            else:
-                                if self.verbose:
-                                    print("Warning: MPS test failed, keeping model on CPU")
-                        except Exception as mps_test_error:
-                            if self.verbose:
-                                print(f"Warning: MPS test failed ({mps_test_error}), keeping model on CPU")
-                    else:
-                        self.device = "cpu"
-                        if self.verbose:
-                            print(f"✓ Whisper {model_name} model loaded on CPU")
-                    self.whisper_model_name = model_name
-                    
-                except Exception as e:
-                    if self.verbose:
-                        print(f"Warning: Failed to load {model_name} model ({e}), trying base model")
-                    
-                    # Fallback - try base if medium fails (better than turbo for translation)
-                    try:
-                        self.whisper_model = whisper.load_model("base", device="cpu")
-                        self.whisper_model_name = "base"
-                        self.device = "cpu"
-                        if self.verbose:
-                            print("✓ Whisper base model loaded on CPU")
-                    except Exception as base_error:
-                        if self.verbose:
-                            print(f"Warning: Failed to load base model ({base_error}), trying turbo model")
-                        
-                        # Last resort - try turbo (English-only optimized, may not translate well)
-                        try:
-                            self.whisper_model = whisper.load_model("turbo", device="cpu")
-                            self.whisper_model_name = "turbo"
-                            self.device = "cpu"
-                            if self.verbose:
-                                print("✓ Whisper turbo model loaded on CPU")
-                        except Exception as turbo_error:
-                            if self.verbose:
-                                print(f"Error: All Whisper models failed to load. Last error: {turbo_error}")
-                            self.whisper_model = None
-
-            finally:
-                pass
+        with _WHISPER_MODELS_LOCK:
+            if self.transcription_method == "faster" and "faster" not in _WHISPER_MODELS:
+                self._load_faster_whisper_model()
+                if self.whisper_model is not None:
+                    _WHISPER_MODELS["faster"] = (self.whisper_model, self.whisper_model_name, self.device, threading.Lock())
+            model_key = "faster" if self.transcription_method == "faster" and "faster" in _WHISPER_MODELS else "whisper"
+            if model_key not in _WHISPER_MODELS and whisper:
+                self._load_whisper_model(whisper)
+                if self.whisper_model is not None:
+                    _WHISPER_MODELS["whisper"] = (self.whisper_model, self.whisper_model_name, self.device, threading.Lock())
+            shared = _WHISPER_MODELS.get(model_key)
+        if shared:
+            self.whisper_model, self.whisper_model_name, self.device, self.transcription_lock = shared
+        else:
+            self.transcription_lock = threading.Lock()
 
         if whisperx:
             try:
@@ -649,9 +676,99 @@ class VideoEvaluator:
             except Exception:
                 self.llm = None
 
+    def _load_whisper_model(self, whisper):
+        """Load an openai-whisper model, falling back to smaller models; leaves whisper_model unset if none load."""
+        # Use medium model for all tasks - it provides the best balance of accuracy and speed for multilingual content
+        # Medium model significantly outperforms base for non-English languages while remaining reasonably fast
+        model_name = "medium"  # Use medium model for optimal multilingual performance
+        # Try MPS (Apple Silicon GPU) first, but load on CPU first to avoid sparse tensor issues
+        try:
+            self.whisper_model = whisper.load_model(model_name, device="cpu")
+            # Test MPS stability before using it
+            import torch
+            if torch.backends.mps.is_available():
+                try:
+                    # Quick stability test: create and use a small tensor
+                    test_tensor = torch.randn(1, 10, device='mps')
+                    test_result = torch.softmax(test_tensor, dim=-1)
+                    if not torch.isnan(test_result).any():
+                        # MPS seems stable, try selective placement
+                        self.whisper_model = self._move_model_to_mps_selective(self.whisper_model)
+                        self.device = "mps"
+                        if self.verbose:
+                            print(f"✓ Whisper {model_name} model loaded on MPS (Apple Silicon GPU)")
+                    else:
+                        if self.verbose:
+                            print("Warning: MPS test failed, keeping model on CPU")
+                except Exception as mps_test_error:
+                    if self.verbose:
+                        print(f"Warning: MPS test failed ({mps_test_error}), keeping model on CPU")
+            else:
+                self.device = "cpu"
+                if self.verbose:
+                    print(f"✓ Whisper {model_name} model loaded on CPU")
+            self.whisper_model_name = model_name
+            
+        except Exception as e:
+            if self.verbose:
+                print(f"Warning: Failed to load {model_name} model ({e}), trying base model")
+            
+            # Fallback - try base if medium fails (better than turbo for translation)
+            try:
+                self.whisper_model = whisper.load_model("base", device="cpu")
+                self.whisper_model_name = "base"
+                self.device = "cpu"
+                if self.verbose:
+                    print("✓ Whisper base model loaded on CPU")
+            except Exception as base_error:
+                if self.verbose:
+                    print(f"Warning: Failed to load base model ({base_error}), trying turbo model")
+                
+                # Last resort - try turbo (English-only optimized, may not translate well)
+                try:
+                    self.whisper_model = whisper.load_model("turbo", device="cpu")
+                    self.whisper_model_name = "turbo"
+                    self.device = "cpu"
+                    if self.verbose:
+                        print("✓ Whisper turbo model loaded on CPU")
+                except Exception as turbo_error:
+                    if self.verbose:
+                        print(f"Error: All Whisper models failed to load. Last error: {turbo_error}")
+                    self.whisper_model = None
+
+    def _load_faster_whisper_model(self, model_name: str = "medium"):
+        """Load an int8-quantized faster-whisper model; leaves whisper_model unset if unavailable.
+
+        CTranslate2 has no MPS backend, so this runs on CUDA when present and otherwise on CPU.
+        """
+        if WhisperModel is None:
+            if self.verbose:
+                print("Warning: faster-whisper is not installed, using openai-whisper instead")
+            return
+        try:
+            import torch
+            device = "cuda" if torch.cuda.is_available() else "cpu"
+        except Exception:
+            device = "cpu"
+        try:
+            model = WhisperModel(model_name, device=device, compute_type="int8" if device == "cpu" else "int8_float16")
+        except Exception as e:
+            if self.verbose:
+                print(f"Warning: Failed to load faster-whisper {model_name} model ({e}), using openai-whisper instead")
+            return
+        self.whisper_model = _FasterWhisperTranscriber(model)
+        self.whisper_model_name = f"{model_name}-int8"
+        self.device = device
+        if self.verbose:
+            print(f"✓ faster-whisper {model_name} model (int8) loaded on {device.upper()}")
+
     def __del__(self):
         """Cleanup temporary directory when object is destroyed."""
-        self._cleanup_temp_dir()
+        try:
+            self._cleanup_temp_dir()
+        except Exception:
+            # At interpreter shutdown the os module may already be torn down
+            pass
 
     def _cleanup_temp_dir(self):
         """Remove temporary directory and all its contents."""
@@ -722,6 +839,74 @@ class VideoEvaluator:
         subprocess.run(cmd, capture_output=True, check=True)
         return out_audio
 
+    def _transcript_cache_path(self, audio_path: str) -> Optional[Path]:
+        """Cache file for this audio under the current model and task, or None if not cacheable."""
+        if self.transcription_method in ["openai", "anthropic"]:
+            model_name = "whisper-1"
+        elif self.whisper_model_name and self.whisper_model_name != "mock":
+            model_name = self.whisper_model_name
+        else:
+            return None
+
+        digest = hashlib.blake2b()
+        with open(audio_path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        task = 'translate' if self.translate_to_english else 'transcribe'
+        return TRANSCRIPT_CACHE_DIR / f"{digest.hexdigest()}-{model_name}-{task}.json"
+
+    def _read_cached_transcript(self, cache_path: Optional[Path]) -> Optional[Dict[str, Any]]:
+        """Load a cached raw transcription result, if present."""
+        if cache_path is None:
+            return None
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        try:
+            # Mark as recently used so eviction keeps it
+            os.utime(cache_path)
+        except OSError:
+            pass
+        return cached
+
+    def _write_cached_transcript(self, cache_path: Optional[Path], res: Dict[str, Any]):
+        """Store a raw transcription result; written to a temp file and renamed so readers never see partial JSON."""
+        if cache_path is None:
+            return
+        cached = {
+            'text': res.get('text', ''),
+            'language': res.get('language', 'unknown'),
+            'segments': [
+                {key: seg.get(key) for key in ('start', 'end', 'text', 'avg_logprob', 'compression_ratio', 'no_speech_prob')}
+                for seg in res.get('segments', []) if isinstance(seg, dict)
+            ]
+        }
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(cached, f)
+                os.replace(tmp_path, cache_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, TypeError, ValueError) as e:
+            if self.verbose:
+                print(f"Warning: Could not cache transcript ({e})")
+            return
+
+        # Evict transcripts that haven't been used recently
+        cutoff = time.time() - TRANSCRIPT_CACHE_MAX_AGE
+        for entry in cache_path.parent.glob('*.json'):
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    entry.unlink()
+            except OSError:
+                continue
+
     def transcribe_with_timestamps(self, audio_path: str) -> Dict[str, Any]:
         """Return transcript, segments with start/end and (if available) token confidences.
         
@@ -731,6 +916,9 @@ class VideoEvaluator:
         - no_speech_prob: Probability of no speech in segment
         
         If translate_to_english is enabled, Whisper will translate non-English audio to English.
+        Results are cached on disk (see TRANSCRIPT_CACHE_DIR), so re-running the same audio
+        with the same model and task skips transcription; entries unused for
+        TRANSCRIPT_CACHE_MAX_AGE are evicted, and clear_cache.sh empties the cache.
         """
         # Suppress warnings in non-verbose mode
         import warnings
@@ -776,12 +964,27 @@ class VideoEvaluator:
                     # Re-raise non-NaN errors
                     raise e
         
+        cache_path = None
+        cached = None
         try:
             if self.verbose:
                 print(f"DEBUG: transcription_method={self.transcription_method}, openai_api_key={'set' if self.openai_api_key else 'NOT SET'}")
             
+            # Any failure to hash the audio is a cache miss; transcription below reports real errors
+            try:
+                cache_path = self._transcript_cache_path(audio_path)
+            except OSError as e:
+                if self.verbose:
+                    print(f"Warning: Could not read audio for transcript cache ({e})")
+            cached = self._read_cached_transcript(cache_path)
+
+            if cached is not None:
+                if self.verbose:
+                    print(f"Using cached transcript ({cache_path.name})")
+                res = cached
+
             # Check if remote transcription is requested (openai or anthropic)
-            if self.transcription_method in ["openai", "anthropic"] and self.transcription_method != "local":
+            elif self.transcription_method in ["openai", "anthropic"] and self.transcription_method != "local":
                 if self.verbose:
                     print(f"Using remote API for transcription (Task: {'translate' if self.translate_to_english else 'transcribe'})")
                 
@@ -831,22 +1034,27 @@ class VideoEvaluator:
                 # Use local whisper model
                 if self.verbose:
                     print("Using local Whisper for transcription")
-                if self.translate_to_english:
-                    # First, detect language without translation
-                    temp_res = _transcribe_with_fallback(audio_path)
-                    detected_language = temp_res.get('language', 'unknown')
-                    
-                    # If not English, translate
-                    if detected_language and detected_language.lower() != 'en':
-                        res = _transcribe_with_fallback(audio_path, task='translate')
+                # The model may be shared with evaluators on other threads; run one transcription at a time
+                with self.transcription_lock:
+                    if self.translate_to_english:
+                        # First, detect language without translation
+                        temp_res = _transcribe_with_fallback(audio_path)
+                        detected_language = temp_res.get('language', 'unknown')
+                        
+                        # If not English, translate
+                        if detected_language and detected_language.lower() != 'en':
+                            res = _transcribe_with_fallback(audio_path, task='translate')
+                        else:
+                            res = temp_res  # Already in English
                     else:
-                        res = temp_res  # Already in English
-                else:
-                    res = _transcribe_with_fallback(audio_path)
+                        res = _transcribe_with_fallback(audio_path)
         except Exception as e:
             if self.verbose:
                 print(f"Error during transcription: {e}")
             raise RuntimeError(f"Transcription failed: {e}")
+
+        if cached is None:
+            self._write_cached_transcript(cache_path, res)
         
         # Re-enable warnings
         if not self.verbose:
@@ -898,25 +1106,96 @@ class VideoEvaluator:
             'quality': quality_summary
         }
 
+    def _probe_video(self, video_path: str) -> Dict[str, Any]:
+        """Read duration, frame rate and frame size of the first video stream with ffprobe."""
+        ffmpeg_cmd = getattr(self, 'ffmpeg_path', 'ffmpeg')
+        # ffprobe ships alongside ffmpeg
+        ffprobe_cmd = str(Path(ffmpeg_cmd).with_name('ffprobe')) if os.sep in ffmpeg_cmd else 'ffprobe'
+        cmd = [
+            ffprobe_cmd, '-v', 'error', '-select_streams', 'v:0',
+            '-show_entries', 'stream=width,height,avg_frame_rate,duration:format=duration',
+            '-of', 'json', str(video_path)
+        ]
+        probe = json.loads(subprocess.run(cmd, capture_output=True, check=True).stdout)
+        stream = probe['streams'][0]
+        rate_num, _, rate_den = stream.get('avg_frame_rate', '0/1').partition('/')
+        fps = float(rate_num) / float(rate_den) if float(rate_den or 0) else 0.0
+        duration = float(stream.get('duration') or probe.get('format', {}).get('duration') or 0.0)
+        return {'width': int(stream['width']), 'height': int(stream['height']), 'fps': fps or 25.0, 'duration': duration}
+
+    def _extract_frames_ffmpeg(self, video_path: str, num_frames: int) -> Tuple[List[str], List[float]]:
+        """Grab evenly spaced frames as JPEGs with a single ffmpeg process.
+
+        Each sample point is its own input with a fast (keyframe) seek, so ffmpeg
+        decodes only around the requested timestamps rather than the whole video.
+        """
+        duration = self._probe_video(video_path)['duration']
+        if duration <= 0:
+            raise ValueError(f"Could not determine duration of {video_path}")
+        timestamps = [duration * i / num_frames for i in range(num_frames)]
+
+        frames_dir = tempfile.mkdtemp(prefix='frames_', dir=self.temp_dir)
+        cmd = [getattr(self, 'ffmpeg_path', 'ffmpeg'), '-v', 'error', '-y']
+        for t in timestamps:
+            cmd += ['-ss', f"{t:.3f}", '-i', str(video_path)]
+        frame_paths = [os.path.join(frames_dir, f"frame_{i:04d}.jpg") for i in range(num_frames)]
+        for i, frame_path in enumerate(frame_paths):
+            cmd += ['-map', f"{i}:v:0", '-frames:v', '1', '-q:v', '4', frame_path]
+        subprocess.run(cmd, capture_output=True, check=True)
+
+        frames = []
+        frame_timestamps = []
+        for frame_path, t in zip(frame_paths, timestamps):
+            # A seek past the last decodable frame produces no output
+            if not os.path.exists(frame_path):
+                continue
+            with open(frame_path, 'rb') as f:
+                frames.append(base64.b64encode(f.read()).decode('utf-8'))
+            frame_timestamps.append(t)
+        return frames, frame_timestamps
+
     def _extract_frames(self, video_path: str, num_frames: int = 8) -> Tuple[List[str], List[float]]:
+        if self._check_ffmpeg():
+            try:
+                return self._extract_frames_ffmpeg(video_path, num_frames)
+            except (subprocess.CalledProcessError, OSError, ValueError, KeyError, IndexError) as e:
+                if not cv2:
+                    raise RuntimeError(f"Frame extraction with ffmpeg failed: {e}") from e
+                if self.verbose:
+                    print(f"Warning: ffmpeg frame extraction failed ({e}), falling back to OpenCV")
+
         if not cv2:
-            raise RuntimeError("OpenCV (cv2) is required for frame extraction but not available.")
+            raise RuntimeError("ffmpeg or OpenCV (cv2) is required for frame extraction but neither is available.")
         
         cap = cv2.VideoCapture(str(video_path))
-        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-        fps = cap.get(cv2.CAP_PROP_FPS) or 25.0
-        frame_indices = [int(total_frames * i / num_frames) for i in range(num_frames)]
-        frames = []
-        timestamps = []
-        for idx in frame_indices:
-            cap.set(cv2.CAP_PROP_POS_FRAMES, idx)
-            ret, frame = cap.read()
-            if not ret:
-                continue
-            _, buf = cv2.imencode('.jpg', frame, [int(cv2.IMWRITE_JPEG_QUALITY), 80])
-            frames.append(base64.b64encode(buf).decode('utf-8'))
-            timestamps.append(idx / fps)
-        cap.release()
+        try:
+            total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+            fps = cap.get(cv2.CAP_PROP_FPS) or 25.0
+            # Videos shorter than num_frames would otherwise repeat indices
+            frame_indices = list(dict.fromkeys(int(total_frames * i / num_frames) for i in range(num_frames)))
+            # A seek decodes forward from the previous keyframe; for targets closer than
+            # about one keyframe interval, decoding straight ahead is cheaper
+            max_forward_grab = int(fps * 2)
+            encode_params = [int(cv2.IMWRITE_JPEG_QUALITY), 80]
+            frames = []
+            timestamps = []
+            next_index = 0  # Index of the frame the next read() returns
+            for idx in frame_indices:
+                gap = idx - next_index
+                if 0 <= gap <= max_forward_grab:
+                    for _ in range(gap):
+                        cap.grab()
+                else:
+                    cap.set(cv2.CAP_PROP_POS_FRAMES, idx)
+                ret, frame = cap.read()
+                next_index = idx + 1
+                if not ret:
+                    continue
+                _, buf = cv2.imencode('.jpg', frame, encode_params)
+                frames.append(base64.b64encode(buf).decode('utf-8'))
+                timestamps.append(idx / fps)
+        finally:
+            cap.release()
         return frames, timestamps
 
     def _calculate_transcription_quality(self, segments: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -1124,6 +1403,15 @@ Transcript excerpt:\n{transcript[:1200]}\n
         
         return chunks
 
+    def _map_llm_calls(self, func: Callable[..., Any], *iterables) -> List[Any]:
+        """Run independent LLM scoring calls concurrently, returning results in input order.
+
+        At most max_concurrent_requests calls are in flight; the provider SDKs
+        retry rate-limited (429) requests themselves.
+        """
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_requests) as executor:
+            return list(executor.map(func, *iterables))
+
     def evaluate_transcript_with_rubric(self, transcript: str, segments: List[Dict[str, Any]], visual_analysis: Optional[str] = None) -> Dict[str, Any]:
         # Check if rubric uses new format (categories) or old format (criteria)
         is_new_format = "categories" in self.rubric
@@ -1136,12 +1424,7 @@ Transcript excerpt:\n{transcript[:1200]}\n
     def _evaluate_with_new_rubric_format(self, transcript: str, segments: List[Dict[str, Any]], visual_analysis: Optional[str] = None) -> Dict[str, Any]:
         """Evaluate using new rubric format with categories and nested criteria."""
         
-        # Check if rubric is too complex (many criteria) - use chunked evaluation
-        total_criteria = sum(len(cat['criteria']) for cat in self.rubric['categories'])
-        if total_criteria > 10:
-            return self._evaluate_complex_rubric_chunked(transcript, segments, visual_analysis)
-        
-        # Original single-prompt evaluation for simpler rubrics
+        # All criteria are scored in a single prompt so the transcript is only sent once
         return self._evaluate_simple_rubric(transcript, segments, visual_analysis)
 
     def _evaluate_with_old_rubric_format(self, transcript: str, segments: List[Dict[str, Any]], visual_analysis: Optional[str] = None) -> Dict[str, Any]:
@@ -1252,22 +1535,21 @@ Visual analysis (if any):\n{visual_analysis or 'None'}
         if self.verbose:
             print(f"✓ Split transcript into {len(chunks)} chunks for evaluation")
         
-        # Evaluate each chunk
-        chunk_results = []
-        for i, chunk in enumerate(chunks):
+        # Evaluate each chunk (concurrently; chunks are independent)
+        def evaluate_chunk(i, chunk):
             if self.verbose:
                 print(f"  Evaluating chunk {i+1}/{len(chunks)}...")
             
             try:
-                chunk_result = self._evaluate_single_chunk_old(chunk, i+1, len(chunks), visual_analysis)
-                chunk_results.append(chunk_result)
+                return self._evaluate_single_chunk_old(chunk, i+1, len(chunks), visual_analysis)
             except Exception as e:
                 if self.verbose:
                     print(f"Warning: Failed to evaluate chunk {i+1} ({e}). Using fallback for this chunk.")
                 
                 # Fallback for this chunk
-                chunk_result = self._fallback_single_chunk_old_evaluation()
-                chunk_results.append(chunk_result)
+                return self._fallback_single_chunk_old_evaluation()
+
+        chunk_results = self._map_llm_calls(evaluate_chunk, range(len(chunks)), chunks)
         
         # Aggregate results across chunks
         return self._aggregate_chunk_results_old(chunk_results)
@@ -1440,14 +1722,12 @@ Visual analysis (if any):\n{visual_analysis or 'None'}
         status = 'pass' if weighted >= self.rubric['thresholds']['pass'] else ('revise' if weighted >= self.rubric['thresholds']['revise'] else 'fail')
         return {"scores": scores, "overall": {"weighted_score": weighted, "method": self.rubric['overall_method'], "pass_status": status}, "short_summary": "Auto summary"}
 
-    def _evaluate_simple_rubric(self, transcript: str, segments: List[Dict[str, Any]], visual_analysis: Optional[str] = None) -> Dict[str, Any]:
-        """Evaluate using new rubric format with categories and nested criteria (original single-prompt approach)."""
-        
-        # Check if transcript is too long - use chunked evaluation
-        if len(transcript) > 4000:
-            return self._evaluate_transcript_chunked(transcript, segments, visual_analysis)
-        
-        # Build prompt for LLM to produce strict JSON per rubric
+    def _new_format_scoring_prompt_parts(self) -> Tuple[str, str]:
+        """Describe every rubric criterion and its expected JSON entry for a single scoring prompt.
+
+        Returns:
+            Tuple of (categories_text, scores_schema)
+        """
         categories_desc = []
         scores_schema_parts = []
 
@@ -1455,13 +1735,28 @@ Visual analysis (if any):\n{visual_analysis or 'None'}
             cat_desc = f"- {category['label']} ({category['category_id']}) - {category['max_points']} points max"
             criteria_desc = []
             for criterion in category['criteria']:
-                criteria_desc.append(f"  * {criterion['label']} ({criterion['criterion_id']}) - {criterion['max_points']} points max")
+                line = f"  * {criterion['label']} ({criterion['criterion_id']}) - {criterion['max_points']} points max"
+                criteria_desc.append(f"{line}: {criterion['desc']}" if criterion.get('desc') else line)
                 scores_schema_parts.append(f'"{criterion["criterion_id"]}": {{"score": <int 0-{criterion["max_points"]}>, "confidence": <int 1-10>, "note": "<justification>"}}')
 
             categories_desc.append(f"{cat_desc}\n" + "\n".join(criteria_desc))
 
-        categories_text = "\n".join(categories_desc)
-        scores_schema = ",\n    ".join(scores_schema_parts)
+        return "\n".join(categories_desc), ",\n    ".join(scores_schema_parts)
+
+    def _scoring_max_tokens(self, minimum: int) -> int:
+        """Output token budget for a prompt scoring every criterion (~100 tokens per criterion)."""
+        total_criteria = sum(len(cat['criteria']) for cat in self.rubric['categories'])
+        return max(minimum, 100 * total_criteria)
+
+    def _evaluate_simple_rubric(self, transcript: str, segments: List[Dict[str, Any]], visual_analysis: Optional[str] = None) -> Dict[str, Any]:
+        """Evaluate using new rubric format with categories and nested criteria (original single-prompt approach)."""
+        
+        # Check if transcript is too long - use chunked evaluation
+        if len(transcript) > 4000:
+            return self._evaluate_transcript_chunked(transcript, segments, visual_analysis)
+        
+        # Build prompt for LLM to produce strict JSON per rubric
+        categories_text, scores_schema = self._new_format_scoring_prompt_parts()
 
         prompt = f"""
 You are an expert demo evaluator. Score the following transcript on a point-based scale for each criterion, provide your confidence level in each score (1-10), and provide a justification.
@@ -1481,19 +1776,6 @@ Return JSON with this EXACT structure:
   "scores": {{
     {scores_schema}
   }},
-  "overall": {{
-    "total_points": <int>,
-    "max_points": {sum(cat['max_points'] for cat in self.rubric['categories'])},
-    "percentage": <float>,
-    "pass_status": "<pass|revise|fail>"
-  }},
-  "categories": {{
-    "category_id": {{
-      "points": <int>,
-      "max_points": <int>,
-      "percentage": <float>
-    }}
-  }},
   "short_summary": "<one sentence summary>"
 }}
 
@@ -1508,7 +1790,7 @@ Visual analysis (if any):\n{visual_analysis or 'None'}
                     resp = client.chat.completions.create(
                         model='gpt-4o-mini',
                         messages=[{"role": "user", "content": prompt}],
-                        max_tokens=1200,
+                        max_tokens=self._scoring_max_tokens(1200),
                         temperature=0,  # Deterministic output for consistent scoring
                         response_format={"type": "json_object"}
                     )
@@ -1533,7 +1815,7 @@ Visual analysis (if any):\n{visual_analysis or 'None'}
                 with self.llm.Anthropic(api_key=self.api_key) as client:
                     resp = client.messages.create(
                         model='claude-3-5-haiku-20241022',
-                        max_tokens=1000,
+                        max_tokens=self._scoring_max_tokens(1000),
                         temperature=0,  # Deterministic output for consistent scoring
                         messages=[{"role": "user", "content": prompt}]
                     )
@@ -1554,277 +1836,36 @@ Visual analysis (if any):\n{visual_analysis or 'None'}
     def _evaluate_transcript_chunked(self, transcript: str, segments: List[Dict[str, Any]], visual_analysis: Optional[str] = None) -> Dict[str, Any]:
         """Evaluate long transcripts by breaking them into overlapping chunks and aggregating results."""
         
-        # Check if rubric is complex (many criteria) - use category-based chunking instead
-        total_criteria = sum(len(cat['criteria']) for cat in self.rubric['categories'])
-        if total_criteria > 10:
-            return self._evaluate_transcript_and_category_chunked(transcript, segments, visual_analysis)
-        
         # Chunk the transcript
         chunks = self._chunk_transcript(transcript, chunk_size=8000, overlap=200)
         
         if self.verbose:
             print(f"✓ Split transcript into {len(chunks)} chunks for evaluation")
         
-        # Evaluate each chunk
-        chunk_results = []
-        for i, chunk in enumerate(chunks):
+        # Evaluate each chunk (concurrently; chunks are independent)
+        def evaluate_chunk(i, chunk):
             if self.verbose:
                 print(f"  Evaluating chunk {i+1}/{len(chunks)}...")
             
             try:
                 # Use the same rubric evaluation but with chunk indicator
-                chunk_result = self._evaluate_single_chunk(chunk, i+1, len(chunks), visual_analysis)
-                chunk_results.append(chunk_result)
+                return self._evaluate_single_chunk(chunk, i+1, len(chunks), visual_analysis)
             except Exception as e:
                 if self.verbose:
                     print(f"Warning: Failed to evaluate chunk {i+1} ({e}). Using fallback for this chunk.")
                 
                 # Fallback for this chunk
-                chunk_result = self._fallback_single_chunk_evaluation()
-                chunk_results.append(chunk_result)
+                return self._fallback_single_chunk_evaluation()
+
+        chunk_results = self._map_llm_calls(evaluate_chunk, range(len(chunks)), chunks)
         
         # Aggregate results across chunks
         return self._aggregate_chunk_results(chunk_results)
 
-    def _evaluate_transcript_and_category_chunked(self, transcript: str, segments: List[Dict[str, Any]], visual_analysis: Optional[str] = None) -> Dict[str, Any]:
-        """Evaluate long transcripts with complex rubrics by breaking transcript into chunks and evaluating categories within each chunk."""
-        
-        # Chunk the transcript
-        chunks = self._chunk_transcript(transcript, chunk_size=8000, overlap=200)
-        
-        if self.verbose:
-            print(f"✓ Split transcript into {len(chunks)} chunks for category-based evaluation")
-        
-        # Evaluate each category across all chunks
-        category_results = {}
-        
-        for category in self.rubric['categories']:
-            if self.verbose:
-                print(f"  Evaluating category '{category['label']}' across {len(chunks)} chunks...")
-            
-            category_scores = {}
-            
-            # Evaluate this category in each transcript chunk
-            for i, chunk in enumerate(chunks):
-                try:
-                    chunk_result = self._evaluate_single_category_in_chunk(category, chunk, i+1, len(chunks), visual_analysis)
-                    # Merge scores from this chunk
-                    for criterion_id, score_data in chunk_result['scores'].items():
-                        if criterion_id not in category_scores:
-                            category_scores[criterion_id] = []
-                        category_scores[criterion_id].append(score_data)
-                        
-                except Exception as e:
-                    if self.verbose:
-                        print(f"Warning: Failed to evaluate category {category['label']} in chunk {i+1} ({e}). Using fallback.")
-                    
-                    # Fallback scores for this category in this chunk
-                    for criterion in category['criteria']:
-                        if criterion['criterion_id'] not in category_scores:
-                            category_scores[criterion['criterion_id']] = []
-                        category_scores[criterion['criterion_id']].append({
-                            "score": int(criterion['max_points'] * 0.6),
-                            "confidence": 3,
-                            "note": f"Auto-generated conservative score for chunk {i+1}"
-                        })
-            
-            # Aggregate scores for this category across chunks
-            aggregated_category_scores = {}
-            category_points = 0
-            
-            for criterion_id, scores_list in category_scores.items():
-                # Average scores across chunks
-                avg_score = sum(s['score'] for s in scores_list) / len(scores_list)
-                # Clamp to rubric max_points for this criterion
-                crit_max = 0
-                for cat in self.rubric['categories']:
-                    for criterion in cat['criteria']:
-                        if criterion['criterion_id'] == criterion_id:
-                            crit_max = criterion.get('max_points', 0)
-                            break
-                    if crit_max:
-                        break
-                clamped_score = max(0, min(round(avg_score), crit_max))
-                max_confidence = max(s['confidence'] for s in scores_list)
-                combined_notes = ' | '.join([s['note'] for s in scores_list if s['note']])
-                
-                aggregated_category_scores[criterion_id] = {
-                    "score": clamped_score,
-                    "confidence": max_confidence,
-                    "note": f"Aggregated from {len(scores_list)} chunks: {combined_notes}"
-                }
-                category_points += clamped_score
-            
-            # Clamp category total to max
-            category_points = max(0, min(category_points, category['max_points']))
-            category_results[category['category_id']] = {
-                "scores": aggregated_category_scores,
-                "category": {
-                    "points": category_points,
-                    "max_points": category['max_points'],
-                    "percentage": (category_points / category['max_points']) * 100 if category['max_points'] > 0 else 0
-                }
-            }
-        
-        # Merge all results
-        all_scores = {}
-        all_categories = {}
-        
-        for cat_id, cat_result in category_results.items():
-            all_scores.update(cat_result['scores'])
-            all_categories[cat_id] = cat_result['category']
-        
-        # Calculate overall results
-        total_points = sum(cat['points'] for cat in all_categories.values())
-        max_points = sum(cat['max_points'] for cat in all_categories.values())
-        percentage = (total_points / max_points) * 100 if max_points > 0 else 0
-        
-        # Use point-based thresholds
-        pass_threshold = self.rubric['thresholds']['pass']
-        revise_threshold = self.rubric['thresholds']['revise']
-        
-        status = 'pass' if total_points >= pass_threshold else ('revise' if total_points >= revise_threshold else 'fail')
-        
-        return {
-            "scores": all_scores,
-            "overall": {
-                "total_points": total_points,
-                "max_points": max_points,
-                "percentage": round(percentage, 1),
-                "pass_status": status
-            },
-            "categories": all_categories,
-            "short_summary": f"Evaluated {len(all_categories)} categories across {len(chunks)} transcript chunks"
-        }
-
-    def _evaluate_single_category_in_chunk(self, category: Dict[str, Any], chunk: str, chunk_num: int, total_chunks: int, visual_analysis: Optional[str] = None) -> Dict[str, Any]:
-        """Evaluate a single category within a transcript chunk."""
-        # Build prompt for this category only
-        criteria_desc = []
-        scores_schema_parts = []
-        
-        for criterion in category['criteria']:
-            criteria_desc.append(f"- {criterion['label']}: {criterion['desc']}")
-            scores_schema_parts.append(f'"{criterion["criterion_id"]}": {{"score": <int 0-{criterion["max_points"]}>, "confidence": <int 1-10>, "note": "<justification>"}}')
-        
-        criteria_text = "\n".join(criteria_desc)
-        scores_schema = ",\n  ".join(scores_schema_parts)
-        
-        prompt = f"""
-You are an expert demo evaluator. Score the following transcript chunk for the category "{category['label']}" on a point-based scale, provide your confidence level in each score (1-10), and provide a justification.
-
-IMPORTANT: Return ONLY valid JSON. Do not include any explanatory text, markdown formatting, or additional content. Start your response with {{ and end with }}.
-
-IMPORTANT: This is chunk {chunk_num} of {total_chunks} from a longer transcript. Evaluate based only on the content in this chunk, but consider the context that this is part of a complete demo presentation.
-
-Category: {category['label']} ({category['max_points']} points total)
-
-Criteria to evaluate:
-{criteria_text}
-
-For each criterion, provide:
-- score: Your evaluation score (0 up to that criterion's max_points listed above)
-- confidence: How confident you are in this score (1-10, where 10 means very confident)
-- note: Brief justification for your score
-
-Return JSON with this EXACT structure:
-{{
-  "scores": {{
-    {scores_schema}
-  }}
-}}
-
-Transcript chunk {chunk_num}/{total_chunks}:\n{chunk[:3000]}
-
-Visual analysis (if any):\n{visual_analysis or 'None'}
-"""
-
-        if self.llm and self.provider == AIProvider.OPENAI:
-            try:
-                with self.llm.OpenAI(api_key=self.api_key) as client:
-                    resp = client.chat.completions.create(
-                        model='gpt-4o-mini',
-                        messages=[{"role": "user", "content": prompt}],
-                        max_tokens=800,
-                        temperature=0,
-                        response_format={"type": "json_object"}
-                    )
-                    text = resp.choices[0].message.content
-                    if text:
-                        result = json.loads(text)
-                        # Clamp scores for this category and recompute category totals
-                        result = self._normalize_new_format_result(result)
-                        return result
-            except Exception as e:
-                if self.verbose:
-                    print(f"Warning: OpenAI API call failed for category {category['label']} in chunk {chunk_num} ({e}). Using fallback.")
-                pass
-                
-        elif self.llm and self.provider == AIProvider.ANTHROPIC:
-            try:
-                with self.llm.Anthropic(api_key=self.api_key) as client:
-                    resp = client.messages.create(
-                        model='claude-3-5-haiku-20241022',
-                        max_tokens=800,
-                        temperature=0,
-                        messages=[{"role": "user", "content": prompt}]
-                    )
-                    if resp.content and len(resp.content) > 0 and hasattr(resp.content[0], 'text'):
-                        text = resp.content[0].text
-                        if text:
-                            try:
-                                result = json.loads(text)
-                                # Clamp scores for this category and recompute category totals
-                                result = self._normalize_new_format_result(result)
-                                return result
-                            except json.JSONDecodeError as e:
-                                if self.verbose:
-                                    print(f"Warning: Failed to parse JSON response for category {category['label']}: {e}")
-                                    print(f"Raw response text: {text[:500]}...")
-                                raise e
-                        else:
-                            if self.verbose:
-                                print(f"Warning: Anthropic response text is empty for category {category['label']} in chunk {chunk_num}")
-                    else:
-                        if self.verbose:
-                            print(f"Warning: Anthropic response missing content or text for category {category['label']} in chunk {chunk_num}")
-                            print(f"Response content: {resp.content}")
-            except Exception as e:
-                if self.verbose:
-                    print(f"Warning: Anthropic API call failed for category {category['label']} in chunk {chunk_num} ({e}). Using fallback.")
-                    print(f"Exception details: {type(e).__name__}: {e}")
-                    import traceback
-                    traceback.print_exc()
-                pass
-        
-        # If we get here, API calls failed - return fallback for this category
-        scores = {}
-        for criterion in category['criteria']:
-            scores[criterion['criterion_id']] = {
-                "score": int(criterion['max_points'] * 0.6),
-                "confidence": 3,
-                "note": f"Auto-generated conservative score for category {category['label']} in chunk {chunk_num}"
-            }
-        
-        return {"scores": scores}
-
     def _evaluate_single_chunk(self, chunk: str, chunk_num: int, total_chunks: int, visual_analysis: Optional[str] = None) -> Dict[str, Any]:
         """Evaluate a single transcript chunk."""
         # Build prompt for LLM to produce strict JSON per rubric
-        categories_desc = []
-        scores_schema_parts = []
-
-        for category in self.rubric['categories']:
-            cat_desc = f"- {category['label']} ({category['category_id']}) - {category['max_points']} points max"
-            criteria_desc = []
-            for criterion in category['criteria']:
-                criteria_desc.append(f"  * {criterion['label']} ({criterion['criterion_id']}) - {criterion['max_points']} points max")
-                scores_schema_parts.append(f'"{criterion["criterion_id"]}": {{"score": <int 0-{criterion["max_points"]}>, "confidence": <int 1-10>, "note": "<justification>"}}')
-
-            categories_desc.append(f"{cat_desc}\n" + "\n".join(criteria_desc))
-
-        categories_text = "\n".join(categories_desc)
-        scores_schema = ",\n    ".join(scores_schema_parts)
+        categories_text, scores_schema = self._new_format_scoring_prompt_parts()
 
         prompt = f"""
 You are an expert demo evaluator. Score the following transcript chunk on a point-based scale for each criterion, provide your confidence level in each score (1-10), and provide a justification.
@@ -1846,19 +1887,6 @@ Return JSON with this EXACT structure:
   "scores": {{
     {scores_schema}
   }},
-  "overall": {{
-    "total_points": <int>,
-    "max_points": {sum(cat['max_points'] for cat in self.rubric['categories'])},
-    "percentage": <float>,
-    "pass_status": "<pass|revise|fail>"
-  }},
-  "categories": {{
-    "category_id": {{
-      "points": <int>,
-      "max_points": <int>,
-      "percentage": <float>
-    }}
-  }},
   "short_summary": "<one sentence summary>"
 }}
 
@@ -1873,7 +1901,7 @@ Visual analysis (if any):\n{visual_analysis or 'None'}
                     resp = client.chat.completions.create(
                         model='gpt-4o-mini',
                         messages=[{"role": "user", "content": prompt}],
-                        max_tokens=1000,
+                        max_tokens=self._scoring_max_tokens(1000),
                         temperature=0,
                         response_format={"type": "json_object"}
                     )
@@ -1893,7 +1921,7 @@ Visual analysis (if any):\n{visual_analysis or 'None'}
                 with self.llm.Anthropic(api_key=self.api_key) as client:
                     resp = client.messages.create(
                         model='claude-3-5-haiku-20241022',
-                        max_tokens=1000,
+                        max_tokens=self._scoring_max_tokens(1000),
                         temperature=0,
                         messages=[{"role": "user", "content": prompt}]
                     )
@@ -2056,153 +2084,6 @@ Visual analysis (if any):\n{visual_analysis or 'None'}
             "short_summary": "Auto-generated conservative chunk evaluation"
         }
 
-    def _evaluate_complex_rubric_chunked(self, transcript: str, segments: List[Dict[str, Any]], visual_analysis: Optional[str] = None) -> Dict[str, Any]:
-        """Evaluate complex rubrics by breaking them into smaller chunks (by category)."""
-        
-        # Check if transcript is too long - use transcript chunking instead
-        if len(transcript) > 4000:
-            return self._evaluate_transcript_chunked(transcript, segments, visual_analysis)
-        
-        scores = {}
-        categories = {}
-        
-        # Evaluate each category separately
-        for category in self.rubric['categories']:
-            category_result = self._evaluate_single_category(category, transcript, segments, visual_analysis)
-            # Merge scores
-            scores.update(category_result['scores'])
-            # Store category results
-            categories[category['category_id']] = category_result['category']
-            
-            if self.verbose:
-                print(f"✓ Evaluated category: {category['label']}")
-        
-        # Calculate overall results
-        total_points = sum(cat['points'] for cat in categories.values())
-        max_points = sum(cat['max_points'] for cat in categories.values())
-        percentage = (total_points / max_points) * 100
-        
-        # Use point-based thresholds
-        pass_threshold = self.rubric['thresholds']['pass']  # Convert from 1-10 scale to percentage
-        revise_threshold = self.rubric['thresholds']['revise']
-        
-        status = 'pass' if total_points >= pass_threshold else ('revise' if total_points >= revise_threshold else 'fail')
-        
-        return {
-            "scores": scores,
-            "overall": {
-                "total_points": total_points,
-                "max_points": max_points,
-                "percentage": round(percentage, 1),
-                "pass_status": status
-            },
-            "categories": categories,
-            "short_summary": f"Evaluated {len(categories)} categories with {len(scores)} criteria"
-        }
-
-    def _evaluate_single_category(self, category: Dict[str, Any], transcript: str, segments: List[Dict[str, Any]], visual_analysis: Optional[str] = None) -> Dict[str, Any]:
-        """Evaluate a single category with its criteria."""
-        # Build prompt for this category only
-        criteria_desc = []
-        scores_schema_parts = []
-        
-        for criterion in category['criteria']:
-            criteria_desc.append(f"- {criterion['label']}: {criterion['desc']}")
-            scores_schema_parts.append(f'"{criterion["criterion_id"]}": {{"score": <int 0-{criterion["max_points"]}>, "confidence": <int 1-10>, "note": "<justification>"}}')
-        
-        criteria_text = "\n".join(criteria_desc)
-        scores_schema = ",\n  ".join(scores_schema_parts)
-        
-        prompt = f"""
-You are an expert demo evaluator. Score the following transcript for the category "{category['label']}" on a point-based scale, provide your confidence level in each score (1-10), and provide a justification.
-
-Category: {category['label']} ({category['max_points']} points total)
-
-Criteria to evaluate:
-{criteria_text}
-
-For each criterion, provide:
-- score: Your evaluation score (0 up to that criterion's max_points listed above)
-- confidence: How confident you are in this score (1-10, where 10 means very confident)
-- note: Brief justification for your score
-
-Return JSON with this EXACT structure:
-{{
-  "scores": {{
-    {scores_schema}
-  }},
-  "category": {{
-    "points": <int>,
-    "max_points": {category['max_points']},
-    "percentage": <float>
-  }}
-}}
-
-Transcript:\n{transcript[:2500]}
-
-Visual analysis (if any):\n{visual_analysis or 'None'}
-"""
-
-        if self.llm and self.provider == AIProvider.OPENAI:
-            try:
-                with self.llm.OpenAI(api_key=self.api_key) as client:
-                    resp = client.chat.completions.create(
-                        model='gpt-4o-mini',
-                        messages=[{"role": "user", "content": prompt}],
-                        max_tokens=800,
-                        temperature=0,
-                        response_format={"type": "json_object"}
-                    )
-                    text = resp.choices[0].message.content
-                    if text:
-                        result = json.loads(text)
-                        # Clamp scores for this category and recompute category totals
-                        result = self._normalize_new_format_result(result)
-                        return result
-            except Exception as e:
-                if self.verbose:
-                    print(f"Warning: OpenAI API call failed for category {category['label']} ({e}). Using fallback.")
-                pass
-                
-        elif self.llm and self.provider == AIProvider.ANTHROPIC:
-            try:
-                with self.llm.Anthropic(api_key=self.api_key) as client:
-                    resp = client.messages.create(
-                        model='claude-3-5-haiku-20241022',
-                        max_tokens=800,
-                        temperature=0,
-                        messages=[{"role": "user", "content": prompt}]
-                    )
-                    result = json.loads(resp.content[0].text)
-                    # Clamp scores for this category and recompute category totals
-                    result = self._normalize_new_format_result(result)
-                    return result
-            except Exception as e:
-                if self.verbose:
-                    print(f"Warning: Anthropic API call failed for category {category['label']} ({e}). Using fallback.")
-                pass
-        
-        # If we get here, API calls failed - return fallback for this category
-        category_points = 0
-        scores = {}
-        for criterion in category['criteria']:
-            score = int(criterion['max_points'] * 0.6)  # Conservative score
-            scores[criterion['criterion_id']] = {
-                "score": score,
-                "confidence": 5,
-                "note": "Auto-generated conservative score"
-            }
-            category_points += score
-        
-        return {
-            "scores": scores,
-            "category": {
-                "points": category_points,
-                "max_points": category['max_points'],
-                "percentage": (category_points / category['max_points']) * 100 if category['max_points'] > 0 else 0
-            }
-        }
-
     def _fallback_new_rubric_evaluation(self) -> Dict[str, Any]:
         """Fallback evaluation for new rubric format when AI calls fail."""
         scores = {}
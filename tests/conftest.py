@@ -1,12 +1,24 @@
 """Shared pytest configuration and fixtures for all tests.
 
-This module provides session-level fixtures including:
+This module provides fixtures including:
 - Automatic cleanup of test artifacts after test session completion
+- A per-test transcript cache directory
 """
 import pytest
 from pathlib import Path
 
 
+@pytest.fixture(autouse=True)
+def isolated_transcript_cache(tmp_path, monkeypatch):
+    """Point the on-disk transcript cache at a per-test directory.
+
+    Keeps tests from reusing each other's (mocked) transcripts or writing
+    into the shared cache under the system temp directory.
+    """
+    from src import video_evaluator
+    monkeypatch.setattr(video_evaluator, "TRANSCRIPT_CACHE_DIR", tmp_path / "transcripts")
+
+
 @pytest.fixture(scope="session", autouse=True)
 def cleanup_test_artifacts():
     """Clean up test result files after all tests complete.
@@ -236,6 +236,25 @@ def test_validate_rubric_valid_new_format():
     assert error is None
 
 
+def test_validate_rubric_new_format_missing_category_fields():
+    """Test validation reports the fields missing from a hierarchical category."""
+    invalid_rubric = {
+        "rubric_id": "test-rubric",
+        "name": "Test Rubric",
+        "version": "1.0",
+        "categories": [
+            {"category_id": "content", "label": "Content Quality", "criteria": []}
+        ],
+        "scale": {"min": 0, "max": 10},
+        "thresholds": {"pass": 7, "revise": 5}
+    }
+
+    is_valid, error = validate_rubric(invalid_rubric)
+    assert is_valid is False
+    assert "missing required fields" in error
+    assert "weight" in error and "max_points" in error
+
+
 def test_evaluate_empty_transcript():
     """Test evaluation handles empty transcript gracefully."""
     evaluator = VideoEvaluator(
@@ -300,6 +319,34 @@ def test_load_rubric_invalid_json():
             invalid_rubric_path.unlink()
 
 
+def test_load_rubric_reuses_parsed_rubric_until_file_changes():
+    """Test load_rubric returns the cached rubric for an unchanged file and re-reads an edited one."""
+    rubrics_dir = Path(__file__).parent.parent / "rubrics"
+    rubric_path = rubrics_dir / "test_cache_temp.json"
+    rubric_data = {
+        "criteria": [{"id": "clarity", "label": "Clarity", "desc": "Clear", "weight": 1.0}],
+        "scale": {"min": 1, "max": 10},
+        "overall_method": "weighted_mean",
+        "thresholds": {"pass": 6.5, "revise": 5.0}
+    }
+
+    try:
+        rubric_path.write_text(json.dumps(rubric_data))
+        first = load_rubric("test_cache_temp")
+        assert first == rubric_data
+        assert load_rubric("test_cache_temp") is first
+
+        # Rewrite with a new mtime; the edited content must be picked up
+        rubric_data["thresholds"]["pass"] = 7.0
+        rubric_path.write_text(json.dumps(rubric_data))
+        stat = rubric_path.stat()
+        os.utime(rubric_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert load_rubric("test_cache_temp")["thresholds"]["pass"] == 7.0
+    finally:
+        if rubric_path.exists():
+            rubric_path.unlink()
+
+
 def test_evaluator_missing_api_key_uses_heuristic():
     """Test evaluator can initialize and produce results without API key."""
     evaluator = VideoEvaluator(
@@ -411,6 +458,63 @@ def test_evaluate_with_hierarchical_rubric():
     assert 'overall' in result
 
 
+def test_new_format_rubric_scores_all_criteria_in_one_request():
+    """Test every criterion is scored from a single LLM request, even for large rubrics."""
+    evaluator = VideoEvaluator(
+        rubric_path="sample-rubric",  # More than 10 criteria
+        provider=AIProvider.OPENAI,
+        enable_vision=False
+    )
+    criterion_ids = [c['criterion_id'] for cat in evaluator.rubric['categories'] for c in cat['criteria']]
+    assert len(criterion_ids) > 10
+
+    client = MagicMock()
+    client.chat.completions.create.return_value.choices = [MagicMock(message=MagicMock(content=json.dumps({
+        "scores": {cid: {"score": 1, "confidence": 8, "note": "ok"} for cid in criterion_ids},
+        "short_summary": "Fine."
+    })))]
+    evaluator.llm = MagicMock()
+    evaluator.llm.OpenAI.return_value.__enter__.return_value = client
+
+    result = evaluator.evaluate_transcript_with_rubric("Demo shows all features.", segments=[])
+
+    assert client.chat.completions.create.call_count == 1
+    prompt = client.chat.completions.create.call_args.kwargs['messages'][0]['content']
+    assert all(cid in prompt for cid in criterion_ids)
+    assert set(result['scores']) == set(criterion_ids)
+    assert result['overall']['total_points'] == len(criterion_ids)
+
+
+def test_transcript_chunks_evaluated_concurrently():
+    """Test chunk scoring calls overlap, bounded by max_concurrent_requests."""
+    import threading
+    import time
+
+    evaluator = VideoEvaluator(
+        rubric_path="sample-rubric",
+        provider=AIProvider.OPENAI,
+        enable_vision=False
+    )
+    in_flight = []
+    peak = []
+    lock = threading.Lock()
+
+    def fake_chunk(chunk, chunk_num, total_chunks, visual_analysis=None):
+        with lock:
+            in_flight.append(chunk_num)
+            peak.append(len(in_flight))
+        time.sleep(0.05)
+        with lock:
+            in_flight.remove(chunk_num)
+        return evaluator._fallback_single_chunk_evaluation()
+
+    with patch.object(evaluator, '_evaluate_single_chunk', side_effect=fake_chunk):
+        result = evaluator._evaluate_transcript_chunked("word " * 10000, [])
+
+    assert 1 < max(peak) <= evaluator.max_concurrent_requests
+    assert 'scores' in result
+
+
 def test_rubric_with_single_criterion():
     """Test rubric validation and evaluation with single criterion."""
     single_criterion_rubric = {
@@ -678,6 +782,59 @@ def test_temp_directory_created():
     assert os.path.exists(evaluator.temp_dir)
 
 
+def test_extract_frames_uses_single_ffmpeg_call():
+    """Test frames are grabbed by one ffmpeg process with one seeked input per frame."""
+    evaluator = VideoEvaluator(
+        rubric_path="sample-rubric",
+        enable_vision=True
+    )
+    ffmpeg_calls = []
+
+    def fake_run(cmd, **kwargs):
+        if 'ffprobe' in cmd[0]:
+            probe = {"streams": [{"width": 640, "height": 360, "avg_frame_rate": "30/1", "duration": "80.0"}]}
+            return MagicMock(stdout=json.dumps(probe).encode())
+        ffmpeg_calls.append(cmd)
+        # Simulate the last seek landing past the final frame (no output written)
+        for path in [arg for arg in cmd if arg.endswith('.jpg')][:-1]:
+            with open(path, 'wb') as f:
+                f.write(b'jpeg')
+        return MagicMock(stdout=b'')
+
+    with patch.object(evaluator, '_check_ffmpeg', return_value=True), \
+         patch('src.video_evaluator.subprocess.run', side_effect=fake_run):
+        frames, timestamps = evaluator._extract_frames("demo.mp4", num_frames=4)
+
+    assert len(ffmpeg_calls) == 1
+    assert ffmpeg_calls[0].count('-ss') == 4
+    assert timestamps == [0.0, 20.0, 40.0]
+    assert frames == ['anBlZw=='] * 3
+
+
+def test_extract_frames_opencv_fallback_reads_nearby_frames_without_seeking():
+    """Test the OpenCV fallback decodes forward to close frames and seeks only for distant ones."""
+    evaluator = VideoEvaluator(
+        rubric_path="sample-rubric",
+        enable_vision=True
+    )
+    fake_cv2 = MagicMock()
+    cap = fake_cv2.VideoCapture.return_value
+    # 40 frames at 10 fps: sample points 0, 10, 20, 30 are each 1s apart
+    cap.get.side_effect = lambda prop: {fake_cv2.CAP_PROP_FRAME_COUNT: 40, fake_cv2.CAP_PROP_FPS: 10.0}[prop]
+    cap.read.return_value = (True, 'frame')
+    fake_cv2.imencode.return_value = (True, b'jpeg')
+
+    with patch.object(evaluator, '_check_ffmpeg', return_value=False), \
+         patch('src.video_evaluator.cv2', fake_cv2):
+        frames, timestamps = evaluator._extract_frames("demo.mp4", num_frames=4)
+
+    cap.set.assert_not_called()
+    assert cap.grab.call_count == 27
+    assert timestamps == [0.0, 1.0, 2.0, 3.0]
+    assert len(frames) == 4
+    cap.release.assert_called_once()
+
+
 # ============================================================================
 # EDGE CASES
 # ============================================================================
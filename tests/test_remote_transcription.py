@@ -14,6 +14,7 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 import json
+import time
 import pytest
 import tempfile
 from pathlib import Path
@@ -135,6 +136,84 @@ def test_remote_transcription_with_valid_key(mock_openai_class):
             audio_path.unlink()
 
 
+@patch('openai.OpenAI')
+def test_remote_transcription_reuses_cached_transcript(mock_openai_class):
+    """Test that transcribing the same audio again is served from the transcript cache."""
+    mock_segment = MagicMock(start=0.0, end=5.0, text="Cached result", avg_logprob=-0.5,
+                             compression_ratio=1.2, no_speech_prob=0.1)
+    mock_transcript = MagicMock(text="Cached result", language="en", segments=[mock_segment])
+    mock_client = MagicMock()
+    mock_client.audio.transcriptions.create.return_value = mock_transcript
+    mock_openai_class.return_value = mock_client
+
+    evaluator = VideoEvaluator(
+        rubric_path="sample-rubric",
+        provider=AIProvider.OPENAI,
+        transcription_method="openai",
+        openai_api_key="valid-openai-key"
+    )
+
+    audio_path = Path(evaluator.temp_dir) / "test.wav"
+    with open(audio_path, 'wb') as f:
+        f.write(b'RIFF' + b'\x00\x00\x00\x00' + b'WAVE')
+
+    first = evaluator.transcribe_with_timestamps(str(audio_path))
+    second = evaluator.transcribe_with_timestamps(str(audio_path))
+
+    assert mock_client.audio.transcriptions.create.call_count == 1
+    assert second['text'] == first['text'] == "Cached result"
+    assert second['segments'] == first['segments']
+
+    # A different task (translation) is cached separately
+    evaluator.translate_to_english = True
+    mock_client.audio.translations.create.return_value = mock_transcript
+    evaluator.transcribe_with_timestamps(str(audio_path))
+    assert mock_client.audio.translations.create.call_count == 1
+
+
+@patch('openai.OpenAI')
+def test_transcription_of_missing_audio_raises_runtime_error(mock_openai_class):
+    """Test that an unreadable audio file is a cache miss and surfaces as a transcription failure."""
+    evaluator = VideoEvaluator(
+        rubric_path="sample-rubric",
+        provider=AIProvider.OPENAI,
+        transcription_method="openai",
+        openai_api_key="valid-openai-key"
+    )
+
+    with pytest.raises(RuntimeError, match="Transcription failed"):
+        evaluator.transcribe_with_timestamps(str(Path(evaluator.temp_dir) / "missing.wav"))
+
+
+@patch('openai.OpenAI')
+def test_transcript_cache_evicts_stale_entries(mock_openai_class):
+    """Test that writing a transcript evicts cache entries unused for TRANSCRIPT_CACHE_MAX_AGE."""
+    from src import video_evaluator
+
+    mock_transcript = MagicMock(text="Fresh", language="en", segments=[])
+    mock_openai_class.return_value.audio.transcriptions.create.return_value = mock_transcript
+
+    video_evaluator.TRANSCRIPT_CACHE_DIR.mkdir(parents=True)
+    stale = video_evaluator.TRANSCRIPT_CACHE_DIR / "stale.json"
+    stale.write_text("{}")
+    old = time.time() - video_evaluator.TRANSCRIPT_CACHE_MAX_AGE - 60
+    os.utime(stale, (old, old))
+
+    evaluator = VideoEvaluator(
+        rubric_path="sample-rubric",
+        provider=AIProvider.OPENAI,
+        transcription_method="openai",
+        openai_api_key="valid-openai-key"
+    )
+    audio_path = Path(evaluator.temp_dir) / "test.wav"
+    audio_path.write_bytes(b'RIFF' + b'\x00\x00\x00\x00' + b'WAVE')
+
+    evaluator.transcribe_with_timestamps(str(audio_path))
+
+    assert not stale.exists()
+    assert len(list(video_evaluator.TRANSCRIPT_CACHE_DIR.glob("*.json"))) == 1
+
+
 def test_remote_transcription_fallback_when_key_missing():
     """Test that remote transcription raises error when OpenAI key is missing."""
     evaluator = VideoEvaluator(
@@ -207,6 +286,86 @@ def test_remote_transcription_with_anthropic_provider(mock_openai_class):
             audio_path.unlink()
 
 
+@patch.dict('src.video_evaluator._WHISPER_MODELS', clear=True)
+@patch('src.video_evaluator.WhisperModel')
+def test_faster_whisper_transcription(mock_whisper_model_class):
+    """Test transcription_method='faster' uses an int8 faster-whisper model with the usual result shape."""
+    mock_segment = MagicMock(start=0.0, end=2.5, text=" Hello from faster-whisper.", avg_logprob=-0.2,
+                             compression_ratio=1.1, no_speech_prob=0.01)
+    mock_model = MagicMock()
+    mock_model.transcribe.return_value = (iter([mock_segment]), MagicMock(language="en"))
+    mock_whisper_model_class.return_value = mock_model
+
+    evaluator = VideoEvaluator(
+        rubric_path="sample-rubric",
+        provider=AIProvider.OPENAI,
+        transcription_method="faster"
+    )
+    assert mock_whisper_model_class.call_args.kwargs['compute_type'] in ("int8", "int8_float16")
+    assert evaluator.whisper_model_name == "medium-int8"
+
+    # The loaded model is shared with later evaluators rather than loaded again
+    other = VideoEvaluator(rubric_path="sample-rubric", provider=AIProvider.OPENAI, transcription_method="faster")
+    assert other.whisper_model is evaluator.whisper_model
+    assert mock_whisper_model_class.call_count == 1
+
+    audio_path = Path(evaluator.temp_dir) / "test.wav"
+    with open(audio_path, 'wb') as f:
+        f.write(b'RIFF' + b'\x00\x00\x00\x00' + b'WAVE')
+
+    result = evaluator.transcribe_with_timestamps(str(audio_path))
+
+    assert mock_model.transcribe.call_args.kwargs['vad_filter'] is True
+    assert result['text'] == "Hello from faster-whisper."
+    assert result['language'] == "en"
+    assert result['segments'][0]['end'] == 2.5
+
+
+@patch.dict('src.video_evaluator._WHISPER_MODELS', clear=True)
+@patch('src.video_evaluator.WhisperModel')
+def test_shared_model_transcribes_one_file_at_a_time(mock_whisper_model_class):
+    """Test evaluators on different threads don't run the shared model concurrently."""
+    import threading
+    import time
+
+    in_flight = []
+    peak = []
+    lock = threading.Lock()
+
+    def fake_transcribe(audio_path, **kwargs):
+        with lock:
+            in_flight.append(audio_path)
+            peak.append(len(in_flight))
+        time.sleep(0.05)
+        with lock:
+            in_flight.remove(audio_path)
+        return iter([]), MagicMock(language="en")
+
+    mock_whisper_model_class.return_value.transcribe.side_effect = fake_transcribe
+
+    evaluators = [
+        VideoEvaluator(rubric_path="sample-rubric", provider=AIProvider.OPENAI, transcription_method="faster")
+        for _ in range(3)
+    ]
+    audio_paths = []
+    for i, evaluator in enumerate(evaluators):
+        audio_path = Path(evaluator.temp_dir) / "test.wav"
+        audio_path.write_bytes(b'RIFF' + bytes([i]) * 4 + b'WAVE')
+        audio_paths.append(str(audio_path))
+
+    threads = [
+        threading.Thread(target=evaluator.transcribe_with_timestamps, args=(audio_path,))
+        for evaluator, audio_path in zip(evaluators, audio_paths)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(peak) == 3
+    assert max(peak) == 1
+
+
 # ============================================================================
 # PROGRESS MESSAGE TESTS
 # ============================================================================
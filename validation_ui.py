@@ -6,6 +6,7 @@ Reusable Streamlit components for displaying rubric validation results.
 Provides consistent validation UI across the application.
 """
 
+import json
 import streamlit as st
 from typing import Dict, Any, Optional, Tuple
 
@@ -110,6 +111,14 @@ def _display_validation_error(
     st.info("The rubric failed validation. Check the error message above for details on what needs to be fixed.")
 
 
+@st.cache_data(show_spinner=False, max_entries=32)
+def _validate_cached(rubric_json: str) -> Tuple[bool, Optional[str]]:
+    """Validate a rubric given as canonical JSON; repeat checks of an unchanged rubric hit the cache."""
+    from rubric_helper import validate_rubric
+
+    return validate_rubric(json.loads(rubric_json))
+
+
 def validate_and_display(
     rubric_data: Dict[str, Any],
     rubric_name: Optional[str] = None,
@@ -126,9 +135,8 @@ def validate_and_display(
     Returns:
         True if valid, False if invalid
     """
-    from rubric_helper import validate_rubric
-
-    is_valid, error_msg = validate_rubric(rubric_data)
+    # Canonical form, so identical rubrics share a cache entry
+    is_valid, error_msg = _validate_cached(json.dumps(rubric_data, sort_keys=True))
     display_validation_results(is_valid, error_msg, rubric_data, mode, rubric_name)
 
     return is_valid